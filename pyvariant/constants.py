@@ -27,6 +27,10 @@ PROTEIN = "protein"
 RNA = "rna"
 STOP_CODON = "stop_codon"
 
+# Strand literals
+NEGATIVE_STRAND = "-"
+POSITIVE_STRAND = "+"
+
 # Variant type literals
 DELETION = "deletion"
 DELINS = "delins"
@@ -4,10 +4,28 @@ from __future__ import annotations
 import os
 import sys
 import warnings
-from functools import lru_cache
+from collections import defaultdict, namedtuple
+from functools import cached_property, lru_cache, wraps
 from itertools import product
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
+import numpy as np
 import pandas as pd
 from gtfparse import read_gtf
 from pyfaidx import Fasta
@@ -27,6 +45,8 @@ from .constants import (
     GENE_ID,
     GENE_NAME,
     INSERTION,
+    NEGATIVE_STRAND,
+    POSITIVE_STRAND,
     PROTEIN,
     PROTEIN_ID,
     RNA,
@@ -38,7 +58,6 @@ from .constants import (
 from .files import tsv_to_dict, txt_to_list
 from .parser import parse
 from .sequence import PyfaidxFasta, get_sequence, mutate_sequence
-from .tables import AMINO_ACID_TABLE
 from .utils import (
     calc_cdna_to_protein,
     classify_seq_change,
@@ -52,8 +71,8 @@ from .utils import (
     match_pep_to_pep,
     reverse_complement,
     reverse_translate,
-    split_by_codon,
     strip_version,
+    translate,
 )
 from .variants import (
     CdnaDeletion,
@@ -101,6 +120,125 @@ from .variants import (
 # Environmental variable that controls how protein duplications are processed (see below)
 GET_ALL_PROTEIN_DUPS = bool(os.environ.get("PYVARIANT_GET_ALL_PROTEIN_DUPS", False))
 
+# Name of the method that maps from one position type to another, for positions and small variants
+# (e.g. (cdna, dna, False) -> '_cdna_to_dna', (cdna, dna, True) -> '_cdna_to_dna_variant')
+POSITION_CONVERTERS = {
+    (from_type, to_type, is_variant): f"_{from_type}_to_{to_type}{'_variant' if is_variant else ''}"
+    for from_type, to_type in product([CDNA, DNA, EXON, PROTEIN, RNA], repeat=2)
+    for is_variant in (False, True)
+}
+
+# Fusion class for each position type
+FUSION_CLASSES = {
+    CDNA: CdnaFusion,
+    DNA: DnaFusion,
+    EXON: ExonFusion,
+    PROTEIN: ProteinFusion,
+    RNA: RnaFusion,
+}
+
+# Small variant class for each position type and type of sequence change
+SMALL_VARIANT_CLASSES: Dict[Tuple[str, str], Type[_SmallVariant]] = {
+    (CDNA, DELETION): CdnaDeletion,
+    (CDNA, DELINS): CdnaDelins,
+    (CDNA, DUPLICATION): CdnaDuplication,
+    (CDNA, INSERTION): CdnaInsertion,
+    (CDNA, SUBSTITUTION): CdnaSubstitution,
+    (DNA, DELETION): DnaDeletion,
+    (DNA, DELINS): DnaDelins,
+    (DNA, DUPLICATION): DnaDuplication,
+    (DNA, INSERTION): DnaInsertion,
+    (DNA, SUBSTITUTION): DnaSubstitution,
+    (EXON, DELETION): ExonSmallVariant,
+    (EXON, DELINS): ExonSmallVariant,
+    (EXON, DUPLICATION): ExonSmallVariant,
+    (EXON, INSERTION): ExonSmallVariant,
+    (EXON, SUBSTITUTION): ExonSmallVariant,
+    (PROTEIN, DELETION): ProteinDeletion,
+    (PROTEIN, DELINS): ProteinDelins,
+    (PROTEIN, DUPLICATION): ProteinDuplication,
+    (PROTEIN, FRAMESHIFT): ProteinFrameshift,
+    (PROTEIN, INSERTION): ProteinInsertion,
+    (PROTEIN, SUBSTITUTION): ProteinSubstitution,
+    (RNA, DELETION): RnaDeletion,
+    (RNA, DELINS): RnaDelins,
+    (RNA, DUPLICATION): RnaDuplication,
+    (RNA, INSERTION): RnaInsertion,
+    (RNA, SUBSTITUTION): RnaSubstitution,
+}
+
+# Maximum number of results to cache for each of the position converters wrapped by `memoize`
+CONVERTER_CACHE_SIZE = 65536
+
+# Maximum number of allele changes to cache in `expand_seq_change`. Ambiguous alleles can expand
+# to many thousands of changes each, so this is kept much smaller than the converter caches.
+SEQ_CHANGE_CACHE_SIZE = 1024
+
+
+def memoize(func: Callable) -> Callable:
+    """Cache the positions returned by a position converter.
+
+    Results are cached on the instance, so they're released along with it and can be dropped with
+    `Core.clear_cache`. Each converter keeps up to `CONVERTER_CACHE_SIZE` results, dropping the
+    oldest first. Converters take lists of IDs and strands, which are not hashable, so they are
+    converted to tuples to key the cache. Results are cached as tuples and a new list is returned
+    on each call, so callers can't modify the cached result.
+
+    Args:
+        func (Callable): Position converter method
+
+    Returns:
+        Callable: Memoized position converter method
+    """
+    name = func.__name__
+
+    def as_key(value: Any) -> Any:
+        return tuple(value) if isinstance(value, list) else value
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs) -> List:
+        key = (tuple(as_key(i) for i in args), tuple((k, as_key(v)) for k, v in kwargs.items()))
+        result = self._cached(
+            name, key, lambda: tuple(func(self, *args, **kwargs)), maxsize=CONVERTER_CACHE_SIZE
+        )
+        return list(result)
+
+    return wrapper
+
+
+# Features that the cDNA-based converters search, with and without the stop codon
+CDS_AND_STOP_CODON = (CDS, STOP_CODON)
+CDS_ONLY = (CDS,)
+
+# Columns that the converters read to build each type of position
+CDNA_COLUMNS = (CONTIG_ID, "strand", GENE_ID, GENE_NAME, TRANSCRIPT_ID, TRANSCRIPT_NAME, PROTEIN_ID)
+DNA_COLUMNS = (CONTIG_ID, "strand")
+EXON_COLUMNS = (
+    CONTIG_ID,
+    "strand",
+    GENE_ID,
+    GENE_NAME,
+    TRANSCRIPT_ID,
+    TRANSCRIPT_NAME,
+    EXON_ID,
+    "exon_number",
+)
+RNA_COLUMNS = (CONTIG_ID, "strand", GENE_ID, GENE_NAME, TRANSCRIPT_ID, TRANSCRIPT_NAME)
+
+# Columns with few distinct values relative to the number of rows, which are stored as categoricals
+# so that `==` and `isin` masks compare integer codes rather than strings
+CATEGORICAL_COLUMNS = [
+    CONTIG_ID,
+    "feature",
+    "strand",
+    GENE_ID,
+    GENE_NAME,
+    TRANSCRIPT_ID,
+    TRANSCRIPT_NAME,
+    EXON_ID,
+    PROTEIN_ID,
+]
+
 
 class Core:
     """Core class that handles converting between position types and retrieving information on
@@ -137,6 +275,9 @@ class Core:
             transcript_alias (Union[str, Dict], optional): Dictionary mapping transcript aliases to their normalized ID, or a path to a text file
         """
         self.df = read_gtf(gtf, result_type="pandas")  # TODO: switch to 'polars'?
+        for col in CATEGORICAL_COLUMNS:
+            if col in self.df:
+                self.df[col] = self.df[col].astype("category")
 
         self.cds_fasta: List[PyfaidxFasta] = []
         self.dna_fasta: List[PyfaidxFasta] = []
@@ -405,10 +546,7 @@ class Core:
                 return list(fusion(self, b1, b2) for b1, b2 in product(breakpoint1, breakpoint2))
 
         # Respect the given strand, otherwise check both strands
-        if strand:
-            strand_ = [strand]
-        else:
-            strand_ = [""]
+        strand_ = [strand or ""]
 
         # Convert the given parameters to a position of the specified type
         if position_type == CDNA:
@@ -629,8 +767,8 @@ class Core:
         for fasta in fasta_list:
             if ref in fasta:
                 return fasta
-        else:
-            raise KeyError(f"Sequence '{ref}' not found")
+
+        raise KeyError(f"Sequence '{ref}' not found")
 
     def _fusion_sequence(
         self,
@@ -1052,6 +1190,63 @@ class Core:
 
         return result
 
+    def map_many(
+        self,
+        *,
+        position_type: str,
+        feature: str,
+        start: Iterable[int],
+        end: Optional[Iterable[int]] = None,
+        to_type: str,
+        canonical: bool = False,
+    ) -> List[List]:
+        """Map many positions on the same feature to another position type.
+
+        The feature is normalized once for the whole batch, which makes this much faster than
+        mapping each position separately when converting, e.g., every record of a VCF.
+
+        Args:
+            position_type (str): Position type for `start` and `end`. One of 'cdna', 'dna', 'exon', 'protein', or 'rna'.
+            feature (str): Feature such as a transcript ID or gene name.
+            start (Iterable[int]): Start positions.
+            end (Iterable[int], optional): End positions, paired with `start`. Defaults to `start`.
+            to_type (str): Position type to map to. One of 'cdna', 'dna', 'exon', 'protein', or 'rna'.
+            canonical (bool, optional): Only consider the canonical transcript when mapping. Defaults to False.
+
+        Raises:
+            ValueError: Unrecognized position type, or the feature could not be found (the same
+                error `variant` raises for it).
+
+        Returns:
+            List[List]: For each start/end pair, the mapped positions (empty if the pair does not map).
+        """
+        if (position_type, to_type, False) not in POSITION_CONVERTERS:
+            raise ValueError(f"Unrecognized position type '{position_type}' or '{to_type}'")
+
+        start = list(start)
+        end = start if end is None else list(end)
+        if len(start) != len(end):
+            raise ValueError(f"Got {len(start)} start positions but {len(end)} end positions")
+
+        # Normalize the feature once for the whole batch
+        feature_ids = (
+            self.contig_ids(feature) if position_type == DNA else self.transcript_ids(feature)
+        )
+        if not feature_ids:
+            raise ValueError("Unable to convert inputs to a variant")
+
+        func = getattr(self, POSITION_CONVERTERS[(position_type, position_type, False)])
+
+        result = []
+        for start_, end_ in zip(start, end):
+            mapped = set()
+            for position in func(feature_ids, int(start_), 0, int(end_), 0, [""], canonical):
+                mapped.update(self._position_to(position, to_type, canonical))
+
+            result.append(sorted(mapped, key=str))
+
+        return result
+
     def _string_to_cdna(self, string: str, canonical: bool) -> List:
         return self._string_to(string, self._position_to_cdna, canonical)
 
@@ -1077,247 +1272,67 @@ class Core:
         return sorted(result)
 
     def _position_to_cdna(self, position, canonical: bool):
-        return self._position_to(
-            position,
-            fusionf=self._position_to_cdna,
-            fusiont=CdnaFusion,
-            cdnavf=self._cdna_to_cdna_variant,
-            dnavf=self._dna_to_cdna_variant,
-            exonvf=self._exon_to_cdna_variant,
-            proteinvf=self._protein_to_cdna_variant,
-            rnavf=self._rna_to_cdna_variant,
-            cdnaf=self._cdna_to_cdna,
-            dnaf=self._dna_to_cdna,
-            exonf=self._exon_to_cdna,
-            proteinf=self._protein_to_cdna,
-            rnaf=self._rna_to_cdna,
-            canonical=canonical,
-        )
+        return self._position_to(position, CDNA, canonical)
 
     def _position_to_dna(self, position, canonical: bool):
-        return self._position_to(
-            position,
-            fusionf=self._position_to_dna,
-            fusiont=DnaFusion,
-            cdnavf=self._cdna_to_dna_variant,
-            dnavf=self._dna_to_dna_variant,
-            exonvf=self._exon_to_dna_variant,
-            proteinvf=self._protein_to_dna_variant,
-            rnavf=self._rna_to_dna_variant,
-            cdnaf=self._cdna_to_dna,
-            dnaf=self._dna_to_dna,
-            exonf=self._exon_to_dna,
-            proteinf=self._protein_to_dna,
-            rnaf=self._rna_to_dna,
-            canonical=canonical,
-        )
+        return self._position_to(position, DNA, canonical)
 
     def _position_to_exon(self, position, canonical: bool):
-        return self._position_to(
-            position,
-            fusionf=self._position_to_exon,
-            fusiont=ExonFusion,
-            cdnavf=self._cdna_to_exon_variant,
-            dnavf=self._dna_to_exon_variant,
-            exonvf=self._exon_to_exon_variant,
-            proteinvf=self._protein_to_exon_variant,
-            rnavf=self._rna_to_exon_variant,
-            cdnaf=self._cdna_to_exon,
-            dnaf=self._dna_to_exon,
-            exonf=self._exon_to_exon,
-            proteinf=self._protein_to_exon,
-            rnaf=self._rna_to_exon,
-            canonical=canonical,
-        )
+        return self._position_to(position, EXON, canonical)
 
     def _position_to_protein(self, position, canonical: bool):
-        return self._position_to(
-            position,
-            fusionf=self._position_to_protein,
-            fusiont=ProteinFusion,
-            cdnavf=self._cdna_to_protein_variant,
-            dnavf=self._dna_to_protein_variant,
-            exonvf=self._exon_to_protein_variant,
-            proteinvf=self._protein_to_protein_variant,
-            rnavf=self._rna_to_protein_variant,
-            cdnaf=self._cdna_to_protein,
-            dnaf=self._dna_to_protein,
-            exonf=self._exon_to_protein,
-            proteinf=self._protein_to_protein,
-            rnaf=self._rna_to_protein,
-            canonical=canonical,
-        )
+        return self._position_to(position, PROTEIN, canonical)
 
     def _position_to_rna(self, position, canonical: bool):
-        return self._position_to(
-            position,
-            fusionf=self._position_to_rna,
-            fusiont=RnaFusion,
-            cdnavf=self._cdna_to_rna_variant,
-            exonvf=self._exon_to_rna_variant,
-            dnavf=self._dna_to_rna_variant,
-            proteinvf=self._protein_to_rna_variant,
-            rnavf=self._rna_to_rna_variant,
-            cdnaf=self._cdna_to_rna,
-            dnaf=self._dna_to_rna,
-            exonf=self._exon_to_rna,
-            proteinf=self._protein_to_rna,
-            rnaf=self._rna_to_rna,
-            canonical=canonical,
-        )
+        return self._position_to(position, RNA, canonical)
 
-    def _position_to(
-        self,
-        position,
-        fusionf: Callable,
-        fusiont: Type,
-        cdnavf: Callable,
-        dnavf: Callable,
-        exonvf: Callable,
-        proteinvf: Callable,
-        rnavf: Callable,
-        cdnaf: Callable,
-        dnaf: Callable,
-        exonf: Callable,
-        proteinf: Callable,
-        rnaf: Callable,
-        canonical: bool,
-    ) -> List:
+    def _position_to(self, position, position_type: str, canonical: bool) -> List:
         if position.is_fusion:
             fusion = cast(_Fusion, position)
-            breakpoint1 = fusionf(fusion.breakpoint1, canonical)
-            breakpoint2 = fusionf(fusion.breakpoint2, canonical)
+            breakpoint1 = self._position_to(fusion.breakpoint1, position_type, canonical)
+            breakpoint2 = self._position_to(fusion.breakpoint2, position_type, canonical)
+            fusiont = FUSION_CLASSES[position_type]
             return [fusiont(self, b1, b2) for b1, b2 in product(breakpoint1, breakpoint2)]
-        elif position.is_small_variant:
-            if position.is_cdna:
-                position = cast(_CdnaSmallVariant, position)
-                return cdnavf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    position.refseq,
-                    position.altseq,
-                    canonical,
-                    position.is_frameshift,
-                )
-            elif position.is_dna:
-                position = cast(_DnaSmallVariant, position)
-                return dnavf(
-                    [position.contig_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    position.refseq,
-                    position.altseq,
-                    canonical,
-                    position.is_frameshift,
-                )
-            elif position.is_exon:
-                position = cast(_ExonSmallVariant, position)
-                return exonvf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    position.refseq,
-                    position.altseq,
-                    canonical,
-                    position.is_frameshift,
-                )
-            elif position.is_protein:
-                position = cast(_ProteinSmallVariant, position)
-                return proteinvf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    position.refseq,
-                    position.altseq,
-                    canonical,
-                    position.is_frameshift,
-                )
-            elif position.is_rna:
-                position = cast(_RnaSmallVariant, position)
-                return rnavf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    position.refseq,
-                    position.altseq,
-                    canonical,
-                    position.is_frameshift,
-                )
-        else:
-            if position.is_cdna:
-                position = cast(CdnaPosition, position)
-                return cdnaf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    canonical,
-                )
-            elif position.is_dna:
-                position = cast(DnaPosition, position)
-                return dnaf(
-                    [position.contig_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    canonical,
-                )
-            elif position.is_exon:
-                position = cast(ExonPosition, position)
-                return exonf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    canonical,
-                )
-            elif position.is_protein:
-                position = cast(ProteinPosition, position)
-                return proteinf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    canonical,
-                )
-            elif position.is_rna:
-                position = cast(RnaPosition, position)
-                return rnaf(
-                    [position.transcript_id],
-                    position.start,
-                    position.start_offset,
-                    position.end,
-                    position.end_offset,
-                    [position.strand],
-                    canonical,
-                )
 
-        raise AssertionError(f"Unknown position type for {position}")
+        key = (position.position_type, position_type, position.is_small_variant)
+        if key not in POSITION_CONVERTERS:
+            raise AssertionError(f"Unknown position type for {position}")
 
+        func = getattr(self, POSITION_CONVERTERS[key])
+        position = cast(_Position, position)
+        if position.is_dna:
+            feature = [position.contig_id]
+        else:
+            transcript_position = cast(
+                Union[CdnaPosition, ExonPosition, ProteinPosition, RnaPosition], position
+            )
+            feature = [transcript_position.transcript_id]
+        if position.is_small_variant:
+            variant = cast(_SmallVariant, position)
+            return func(
+                feature,
+                position.start,
+                position.start_offset,
+                position.end,
+                position.end_offset,
+                [position.strand],
+                variant.refseq,
+                variant.altseq,
+                canonical,
+                variant.is_frameshift,
+            )
+        else:
+            return func(
+                feature,
+                position.start,
+                position.start_offset,
+                position.end,
+                position.end_offset,
+                [position.strand],
+                canonical,
+            )
+
+    @memoize
     def _cdna_to_cdna(
         self,
         transcript_id: List[str],
@@ -1329,32 +1344,28 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[CdnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["cdna_start"] <= n)
-                & (self.df["cdna_end"] >= n)
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask].iterrows():
-                # If the offset position can be normalized to a non-offset position, do so.
-                # Otherwise just return an offset position.
-                n_ = n + offset
-                if cds.cdna_start <= n_ <= cds.cdna_end:
-                    n = n_
-                    offset = 0
+            for cds in self._records(rows, CDNA_COLUMNS + ("cdna_start", "cdna_end")):
+                # The rows were matched on `n`, so only an offset position needs checking. If it can
+                # be normalized to a non-offset position, do so. Otherwise just return an offset
+                # position.
+                if offset:
+                    n_ = n + offset
+                    if cds.cdna_start <= n_ <= cds.cdna_end:
+                        n = n_
+                        offset = 0
 
                 result.append(
-                    CdnaPosition(
+                    CdnaPosition._fast_init(
                         _core=self,
                         contig_id=cds.contig_id,
                         start=n,
@@ -1372,11 +1383,24 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, feature, [start, end], "cdna_start", "cdna_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
+        elif (
+            start_offset == end_offset == 0
+            and start <= end
+            and np.array_equal(rows_start, rows_end)
+        ):
+            # Both positions are in the same rows, so the end positions would only differ from the
+            # start positions by their end
+            return sorted({i.copy_from(i, end=end) for i in result_start}, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _cdna_to_cdna_variant(
@@ -1411,6 +1435,7 @@ class Core:
 
         return result
 
+    @memoize
     def _cdna_to_dna(
         self,
         transcript_id: List[str],
@@ -1422,33 +1447,25 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[DnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["cdna_start"] <= n)
-                & (self.df["cdna_end"] >= n)
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask].iterrows():
-                if cds.strand == "-":
-                    new_start = new_end = cds.end - (n - cds.cdna_start) - offset
-                else:
-                    new_start = new_end = cds.start + (n - cds.cdna_start) + offset
+            new_positions = self._relative_to_genomic(rows, n, offset, "cdna_start")
+            offset = 0
 
-                offset = 0
+            for cds, new_start in zip(self._records(rows, DNA_COLUMNS), new_positions):
+                new_start = new_end = int(new_start)
 
                 # TODO: Check that new new_start is actually on the contig
                 result.append(
-                    DnaPosition(
+                    DnaPosition._fast_init(
                         _core=self,
                         contig_id=cds.contig_id,
                         start=new_start,
@@ -1461,11 +1478,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, feature, [start, end], "cdna_start", "cdna_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, CONTIG_ID)
 
     def _cdna_to_dna_variant(
@@ -1512,25 +1534,20 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[ExonPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask_cds = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["cdna_start"] <= n)
-                & (self.df["cdna_end"] >= n)
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask_cds].iterrows():
+            for cds in self._records(rows, ("cdna_start", "cdna_end", "exon_number")):
                 # If the offset position can be normalized to a non-offset position, do so.
                 # Otherwise skip this iteration since it means that the position is not on an exon.
+                # Every row is checked, since the rows were matched on `n` before any normalization.
                 n_ = n + offset
                 if cds.cdna_start <= n_ <= cds.cdna_end:
                     n = n_
@@ -1538,14 +1555,14 @@ class Core:
                 else:
                     continue
 
-                mask_exon = (
-                    (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                    & (self.df["exon_number"] == cds.exon_number)
-                    & (self.df["feature"] == EXON)
+                exon_number = int(cds.exon_number)
+                rows_exon = self._rows_with(
+                    (TRANSCRIPT_ID, "exon_number"), [(i, exon_number) for i in transcript_id]
                 )
-                for _, exon in self.df[mask_exon].iterrows():
+                rows_exon = rows_exon[self._matches_any("feature", rows_exon, [EXON])]
+                for exon in self._records(rows_exon, EXON_COLUMNS):
                     result.append(
-                        ExonPosition(
+                        ExonPosition._fast_init(
                             _core=self,
                             contig_id=exon.contig_id,
                             start=int(exon.exon_number),
@@ -1563,11 +1580,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, feature, [start, end], "cdna_start", "cdna_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _cdna_to_exon_variant(
@@ -1718,33 +1740,31 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[RnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["cdna_start"] <= n)
-                & (self.df["cdna_end"] >= n)
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask].iterrows():
-                # If the offset position can be normalized to a non-offset position, do so.
-                # Otherwise just return an offset position.
-                n_ = n + offset
-                if cds.cdna_start <= n_ <= cds.cdna_end:
-                    n = n_
-                    offset = 0
-
-                new_start = new_end = cds.transcript_start + (n - cds.cdna_start)
+            for cds in self._records(
+                rows, RNA_COLUMNS + ("cdna_start", "cdna_end", "transcript_start")
+            ):
+                # The rows were matched on `n`, so only an offset position needs checking. If it can
+                # be normalized to a non-offset position, do so. Otherwise just return an offset
+                # position.
+                if offset:
+                    n_ = n + offset
+                    if cds.cdna_start <= n_ <= cds.cdna_end:
+                        n = n_
+                        offset = 0
+
+                new_start = new_end = int(cds.transcript_start + (n - cds.cdna_start))
                 result.append(
-                    RnaPosition(
+                    RnaPosition._fast_init(
                         _core=self,
                         contig_id=cds.contig_id,
                         start=new_start,
@@ -1761,11 +1781,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, feature, [start, end], "cdna_start", "cdna_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _cdna_to_rna_variant(
@@ -1803,6 +1828,7 @@ class Core:
 
         return result
 
+    @memoize
     def _dna_to_cdna(
         self,
         contig_id: List[str],
@@ -1814,35 +1840,27 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[CdnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         def convert(n: int, offset: int):
             result = []
 
             for strand_ in strand:
-                n_ = (n - offset) if strand_ == "-" else (n + offset)
+                n_ = (n - offset) if strand_ == NEGATIVE_STRAND else (n + offset)
                 offset = 0
 
-                mask = (
-                    (self.df[CONTIG_ID].isin(contig_id))
-                    & (self.df["start"] <= n_)
-                    & (self.df["end"] >= n_)
-                    & (self.df["feature"].isin(feature))
-                )
+                rows = self._query_interval(CONTIG_ID, contig_id, feature, n_)
                 if strand_:
-                    mask = mask & (self.df["strand"] == strand_)
-
-                for _, cds in self.df[mask].iterrows():
-                    if cds.strand == "-":
-                        new_start = new_end = cds.end - n_ + cds.cdna_start
-                    else:
-                        new_start = new_end = n_ - cds.start + cds.cdna_start
+                    rows = rows[self._matches_any("strand", rows, [strand_])]
+                if canonical:
+                    rows = rows[self._canonical_rows[rows]]
 
-                    if canonical and not self.is_canonical_transcript(cds.transcript_id):
-                        continue
+                new_positions = self._genomic_to_relative(rows, n_, "cdna_start")
+                for cds, new_start in zip(self._records(rows, CDNA_COLUMNS), new_positions):
+                    new_start = new_end = int(new_start)
 
                     result.append(
-                        CdnaPosition(
+                        CdnaPosition._fast_init(
                             _core=self,
                             contig_id=cds.contig_id,
                             start=new_start,
@@ -1862,7 +1880,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -1902,6 +1920,7 @@ class Core:
 
         return result
 
+    @memoize
     def _dna_to_dna(
         self,
         contig_id: List[str],
@@ -1916,27 +1935,21 @@ class Core:
 
         # TODO: Check that new new_start is actually on the contig
         for contig_id_, strand_ in product(contig_id, strand):
-            if strand_ == "-":
-                new_start = start - start_offset
-                new_end = end - end_offset
-            else:
-                new_start = start + start_offset
-                new_end = end + end_offset
-
+            # Only the first contig/strand pair is shifted by the offsets. Sort the start and end
+            # positions after adjusting by offsets.
+            sign = -1 if strand_ == NEGATIVE_STRAND else 1
+            new_start, new_end = sorted([start + sign * start_offset, end + sign * end_offset])
             start_offset = 0
             end_offset = 0
 
-            # Sort the start and end positions after adjusting by offsets
-            new_start, new_end = sorted([new_start, new_end])
-
             result.append(
-                DnaPosition(
+                DnaPosition._fast_init(
                     _core=self,
                     contig_id=contig_id_,
                     start=new_start,
-                    start_offset=start_offset,
+                    start_offset=0,
                     end=new_end,
-                    end_offset=end_offset,
+                    end_offset=0,
                     strand=strand_,
                 )
             )
@@ -1984,24 +1997,18 @@ class Core:
             result = []
 
             for strand_ in strand:
-                n_ = (n - offset) if strand_ == "-" else (n + offset)
+                n_ = (n - offset) if strand_ == NEGATIVE_STRAND else (n + offset)
                 offset = 0
 
-                mask = (
-                    (self.df[CONTIG_ID].isin(contig_id))
-                    & (self.df["start"] <= n_)
-                    & (self.df["end"] >= n_)
-                    & (self.df["feature"] == EXON)
-                )
+                rows = self._query_interval(CONTIG_ID, contig_id, [EXON], n_)
                 if strand_:
-                    mask = mask & (self.df["strand"] == strand_)
-
-                for _, exon in self.df[mask].iterrows():
-                    if canonical and not self.is_canonical_transcript(exon.transcript_id):
-                        continue
+                    rows = rows[self._matches_any("strand", rows, [strand_])]
+                if canonical:
+                    rows = rows[self._canonical_rows[rows]]
 
+                for exon in self._records(rows, EXON_COLUMNS):
                     result.append(
-                        ExonPosition(
+                        ExonPosition._fast_init(
                             _core=self,
                             contig_id=exon.contig_id,
                             start=int(exon.exon_number),
@@ -2021,7 +2028,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -2123,29 +2130,21 @@ class Core:
             result = []
 
             for strand_ in strand:
-                n_ = (n - offset) if strand_ == "-" else (n + offset)
+                n_ = (n - offset) if strand_ == NEGATIVE_STRAND else (n + offset)
                 offset = 0
 
-                mask = (
-                    (self.df[CONTIG_ID].isin(contig_id))
-                    & (self.df["start"] <= n_)
-                    & (self.df["end"] >= n_)
-                    & (self.df["feature"] == EXON)
-                )
+                rows = self._query_interval(CONTIG_ID, contig_id, [EXON], n_)
                 if strand_:
-                    mask = mask & (self.df["strand"] == strand_)
+                    rows = rows[self._matches_any("strand", rows, [strand_])]
+                if canonical:
+                    rows = rows[self._canonical_rows[rows]]
 
-                for _, exon in self.df[mask].iterrows():
-                    if exon.strand == "-":
-                        new_start = new_end = exon.end - n_ + exon.transcript_start
-                    else:
-                        new_start = new_end = n_ - exon.start + exon.transcript_start
-
-                    if canonical and not self.is_canonical_transcript(exon.transcript_id):
-                        continue
+                new_positions = self._genomic_to_relative(rows, n_, "transcript_start")
+                for exon, new_start in zip(self._records(rows, RNA_COLUMNS), new_positions):
+                    new_start = new_end = int(new_start)
 
                     result.append(
-                        RnaPosition(
+                        RnaPosition._fast_init(
                             _core=self,
                             contig_id=exon.contig_id,
                             start=new_start,
@@ -2164,7 +2163,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -2196,6 +2195,7 @@ class Core:
 
         return result
 
+    @memoize
     def _exon_to_cdna(
         self,
         transcript_id: List[str],
@@ -2207,7 +2207,7 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[CdnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
@@ -2220,19 +2220,16 @@ class Core:
             # TODO: Is there a reasonable case where an exon position would have an offset?
             assert not offset, offset
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["exon_number"] == float(n))
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask].iterrows():
+            rows = self._rows_with((TRANSCRIPT_ID, "exon_number"), [(i, n) for i in transcript_id])
+            rows = rows[self._matches_any("feature", rows, feature)]
+            for cds in self._records(rows, CDNA_COLUMNS + ("cdna_start", "cdna_end")):
                 result.append(
-                    CdnaPosition(
+                    CdnaPosition._fast_init(
                         _core=self,
                         contig_id=cds.contig_id,
-                        start=cds.cdna_start,
+                        start=int(cds.cdna_start),
                         start_offset=offset,
-                        end=cds.cdna_end,
+                        end=int(cds.cdna_end),
                         end_offset=offset,
                         strand=cds.strand,
                         gene_id=cds.gene_id,
@@ -2247,7 +2244,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -2268,6 +2265,7 @@ class Core:
     ) -> List[_ExonSmallVariant]:
         return []
 
+    @memoize
     def _exon_to_dna(
         self,
         transcript_id: List[str],
@@ -2289,19 +2287,16 @@ class Core:
             # TODO: Is there a reasonable case where an exon position would have an offset?
             assert not offset, offset
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["exon_number"] == float(n))
-                & (self.df["feature"] == EXON)
-            )
-            for _, exon in self.df[mask].iterrows():
+            rows = self._rows_with((TRANSCRIPT_ID, "exon_number"), [(i, n) for i in transcript_id])
+            rows = rows[self._matches_any("feature", rows, [EXON])]
+            for exon in self._records(rows, DNA_COLUMNS + ("start", "end")):
                 result.append(
-                    DnaPosition(
+                    DnaPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
-                        start=exon.start,
+                        start=int(exon.start),
                         start_offset=offset,
-                        end=exon.end,
+                        end=int(exon.end),
                         end_offset=offset,
                         strand=exon.strand,
                     )
@@ -2311,7 +2306,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, CONTIG_ID)
@@ -2332,6 +2327,7 @@ class Core:
     ) -> List[_ExonSmallVariant]:
         return []
 
+    @memoize
     def _exon_to_exon(
         self,
         transcript_id: List[str],
@@ -2353,14 +2349,11 @@ class Core:
             # TODO: Is there a reasonable case where an exon position would have an offset?
             assert not offset, offset
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["exon_number"] == float(n))
-                & (self.df["feature"] == EXON)
-            )
-            for _, exon in self.df[mask].iterrows():
+            rows = self._rows_with((TRANSCRIPT_ID, "exon_number"), [(i, n) for i in transcript_id])
+            rows = rows[self._matches_any("feature", rows, [EXON])]
+            for exon in self._records(rows, EXON_COLUMNS):
                 result.append(
-                    ExonPosition(
+                    ExonPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
                         start=int(exon.exon_number),
@@ -2380,7 +2373,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -2401,6 +2394,7 @@ class Core:
     ) -> List[_ExonSmallVariant]:
         return []
 
+    @memoize
     def _exon_to_protein(
         self,
         transcript_id: List[str],
@@ -2453,6 +2447,7 @@ class Core:
     ) -> List[_ExonSmallVariant]:
         return []
 
+    @memoize
     def _exon_to_rna(
         self,
         transcript_id: List[str],
@@ -2474,19 +2469,16 @@ class Core:
             # TODO: Is there a reasonable case where an exon position would have an offset?
             assert not offset, offset
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["exon_number"] == float(n))
-                & (self.df["feature"] == EXON)
-            )
-            for _, exon in self.df[mask].iterrows():
+            rows = self._rows_with((TRANSCRIPT_ID, "exon_number"), [(i, n) for i in transcript_id])
+            rows = rows[self._matches_any("feature", rows, [EXON])]
+            for exon in self._records(rows, RNA_COLUMNS + ("transcript_start", "transcript_end")):
                 result.append(
-                    RnaPosition(
+                    RnaPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
-                        start=exon.transcript_start,
+                        start=int(exon.transcript_start),
                         start_offset=offset,
-                        end=exon.transcript_end,
+                        end=int(exon.transcript_end),
                         end_offset=offset,
                         strand=exon.strand,
                         gene_id=exon.gene_id,
@@ -2500,7 +2492,7 @@ class Core:
 
         result_start = convert(start, start_offset)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
             result_end = convert(end, end_offset)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
@@ -2521,6 +2513,7 @@ class Core:
     ) -> List[_ExonSmallVariant]:
         return []
 
+    @memoize
     def _protein_to_cdna(
         self,
         transcript_id: List[str],
@@ -2615,24 +2608,10 @@ class Core:
         strand: List[str],
         canonical: bool = False,
     ) -> List[DnaPosition]:
-        result = []
-
-        for cdna in self._protein_to_cdna(
+        cdna = self._protein_to_cdna(
             transcript_id, start, start_offset, end, end_offset, strand, canonical=canonical
-        ):
-            result.extend(
-                self._cdna_to_dna(
-                    [cdna.transcript_id],
-                    cdna.start,
-                    cdna.start_offset,
-                    cdna.end,
-                    cdna.end_offset,
-                    [cdna.strand],
-                    canonical=canonical,
-                )
-            )
-
-        return sorted(set(result))
+        )
+        return self._map_each(cdna, self._cdna_to_dna, canonical=canonical)
 
     def _protein_to_dna_variant(
         self,
@@ -2648,7 +2627,7 @@ class Core:
         is_frameshift: bool = False,
         validate: bool = True,
     ) -> List[_DnaSmallVariant]:
-        result = []
+        result = set()
 
         for cdna in self._protein_to_cdna_variant(
             transcript_id,
@@ -2663,7 +2642,7 @@ class Core:
             is_frameshift=is_frameshift,
             validate=validate,
         ):
-            result.extend(
+            result.update(
                 self._cdna_to_dna_variant(
                     [cdna.transcript_id],
                     cdna.start,
@@ -2680,7 +2659,7 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
     def _protein_to_exon(
         self,
@@ -2692,24 +2671,10 @@ class Core:
         strand: List[str],
         canonical: bool = False,
     ) -> List[ExonPosition]:
-        result = []
-
-        for cdna in self._protein_to_cdna(
+        cdna = self._protein_to_cdna(
             transcript_id, start, start_offset, end, end_offset, strand, canonical=canonical
-        ):
-            result.extend(
-                self._cdna_to_exon(
-                    [cdna.transcript_id],
-                    cdna.start,
-                    cdna.start_offset,
-                    cdna.end,
-                    cdna.end_offset,
-                    [cdna.strand],
-                    canonical=canonical,
-                )
-            )
-
-        return sorted(set(result))
+        )
+        return self._map_each(cdna, self._cdna_to_exon, canonical=canonical)
 
     def _protein_to_exon_variant(
         self,
@@ -2725,7 +2690,7 @@ class Core:
         is_frameshift: bool = False,
         validate: bool = True,
     ) -> List[_ExonSmallVariant]:
-        result = []
+        result = set()
 
         for cdna in self._protein_to_cdna_variant(
             transcript_id,
@@ -2740,7 +2705,7 @@ class Core:
             is_frameshift=is_frameshift,
             validate=validate,
         ):
-            result.extend(
+            result.update(
                 self._cdna_to_exon_variant(
                     [cdna.transcript_id],
                     cdna.start,
@@ -2757,7 +2722,7 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
     def _protein_to_protein(
         self,
@@ -2769,24 +2734,10 @@ class Core:
         strand: List[str],
         canonical: bool = False,
     ) -> List[ProteinPosition]:
-        result = []
-
-        for cdna in self._protein_to_cdna(
+        cdna = self._protein_to_cdna(
             transcript_id, start, start_offset, end, end_offset, strand, canonical=canonical
-        ):
-            result.extend(
-                self._cdna_to_protein(
-                    [cdna.transcript_id],
-                    cdna.start,
-                    cdna.start_offset,
-                    cdna.end,
-                    cdna.end_offset,
-                    [cdna.strand],
-                    canonical=canonical,
-                )
-            )
-
-        return sorted(set(result))
+        )
+        return self._map_each(cdna, self._cdna_to_protein, canonical=canonical)
 
     def _protein_to_protein_variant(
         self,
@@ -2802,13 +2753,13 @@ class Core:
         is_frameshift: bool = False,
         validate: bool = True,
     ) -> List[_ProteinSmallVariant]:
-        result = []
+        result = set()
 
         if is_frameshift:
             for protein in self._protein_to_protein(
                 transcript_id, start, start_offset, end, end_offset, strand, canonical
             ):
-                result.extend(
+                result.update(
                     self._position_to_small_variant(
                         protein, refseq, altseq, is_frameshift=is_frameshift, validate=validate
                     )
@@ -2827,7 +2778,7 @@ class Core:
                 is_frameshift=is_frameshift,
                 validate=validate,
             ):
-                result.extend(
+                result.update(
                     self._cdna_to_protein_variant(
                         [cdna.transcript_id],
                         cdna.start,
@@ -2843,7 +2794,7 @@ class Core:
                     )
                 )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
     def _protein_to_rna(
         self,
@@ -2855,24 +2806,10 @@ class Core:
         strand: List[str],
         canonical: bool = False,
     ) -> List[RnaPosition]:
-        result = []
-
-        for cdna in self._protein_to_cdna(
+        cdna = self._protein_to_cdna(
             transcript_id, start, start_offset, end, end_offset, strand, canonical=canonical
-        ):
-            result.extend(
-                self._cdna_to_rna(
-                    [cdna.transcript_id],
-                    cdna.start,
-                    cdna.start_offset,
-                    cdna.end,
-                    cdna.end_offset,
-                    [cdna.strand],
-                    canonical=canonical,
-                )
-            )
-
-        return sorted(set(result))
+        )
+        return self._map_each(cdna, self._cdna_to_rna, canonical=canonical)
 
     def _protein_to_rna_variant(
         self,
@@ -2888,7 +2825,7 @@ class Core:
         is_frameshift: bool = False,
         validate: bool = True,
     ) -> List[_RnaSmallVariant]:
-        result = []
+        result = set()
 
         for cdna in self._protein_to_cdna_variant(
             transcript_id,
@@ -2903,7 +2840,7 @@ class Core:
             is_frameshift=is_frameshift,
             validate=validate,
         ):
-            result.extend(
+            result.update(
                 self._cdna_to_rna_variant(
                     [cdna.transcript_id],
                     cdna.start,
@@ -2919,8 +2856,9 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
+    @memoize
     def _rna_to_cdna(
         self,
         transcript_id: List[str],
@@ -2932,33 +2870,31 @@ class Core:
         canonical: bool = False,
         include_stop: bool = True,
     ) -> List[CdnaPosition]:
-        feature = [CDS, STOP_CODON] if include_stop else [CDS]
+        feature = CDS_AND_STOP_CODON if include_stop else CDS_ONLY
 
         if canonical:
             transcript_id = [i for i in transcript_id if self.is_canonical_transcript(i)]
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["transcript_start"] <= n)
-                & (self.df["transcript_end"] >= n)
-                & (self.df["feature"].isin(feature))
-            )
-            for _, cds in self.df[mask].iterrows():
-                # If the offset position can be normalized to a non-offset position, do so.
-                # Otherwise just return an offset position.
-                n_ = n + offset
-                if cds.cdna_start <= n_ <= cds.cdna_end:
-                    n = n_
-                    offset = 0
-
-                new_start = new_end = cds.cdna_start + (n - cds.transcript_start)
+            for cds in self._records(
+                rows, CDNA_COLUMNS + ("cdna_start", "cdna_end", "transcript_start")
+            ):
+                # The rows were matched on `n`, so only an offset position needs checking. If it can
+                # be normalized to a non-offset position, do so. Otherwise just return an offset
+                # position.
+                if offset:
+                    n_ = n + offset
+                    if cds.cdna_start <= n_ <= cds.cdna_end:
+                        n = n_
+                        offset = 0
+
+                new_start = new_end = int(cds.cdna_start + (n - cds.transcript_start))
                 result.append(
-                    CdnaPosition(
+                    CdnaPosition._fast_init(
                         _core=self,
                         contig_id=cds.contig_id,
                         start=new_start,
@@ -2976,11 +2912,21 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID,
+            transcript_id,
+            feature,
+            [start, end],
+            "transcript_start",
+            "transcript_end",
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _rna_to_cdna_variant(
@@ -3018,6 +2964,7 @@ class Core:
 
         return result
 
+    @memoize
     def _rna_to_dna(
         self,
         transcript_id: List[str],
@@ -3033,27 +2980,18 @@ class Core:
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["transcript_start"] <= n)
-                & (self.df["transcript_end"] >= n)
-                & (self.df["feature"] == EXON)
-            )
-            exon_df = self.df[mask]
-            for _, exon in exon_df.iterrows():
-                if exon.strand == "-":
-                    new_start = new_end = exon.end - (n - exon.transcript_start) - offset
-                else:
-                    new_start = new_end = exon.start + (n - exon.transcript_start) + offset
+            new_positions = self._relative_to_genomic(rows, n, offset, "transcript_start")
+            offset = 0
 
-                offset = 0
+            for exon, new_start in zip(self._records(rows, DNA_COLUMNS), new_positions):
+                new_start = new_end = int(new_start)
 
                 # TODO: Check that new new_start is actually on the contig
                 result.append(
-                    DnaPosition(
+                    DnaPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
                         start=new_start,
@@ -3066,11 +3004,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, [EXON], [start, end], "transcript_start", "transcript_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, CONTIG_ID)
 
     def _rna_to_dna_variant(
@@ -3100,6 +3043,7 @@ class Core:
 
         return result
 
+    @memoize
     def _rna_to_exon(
         self,
         transcript_id: List[str],
@@ -3115,18 +3059,13 @@ class Core:
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["transcript_start"] <= n)
-                & (self.df["transcript_end"] >= n)
-                & (self.df["feature"] == EXON)
-            )
-            for _, exon in self.df[mask].iterrows():
+            for exon in self._records(rows, EXON_COLUMNS + ("transcript_start", "transcript_end")):
                 # If the offset position can be normalized to a non-offset position, do so.
                 # Otherwise skip this iteration since it means that the position is not on an exon.
+                # Every row is checked, since the rows were matched on `n` before any normalization.
                 n_ = n + offset
                 if exon.transcript_start <= n_ <= exon.transcript_end:
                     n = n_
@@ -3135,7 +3074,7 @@ class Core:
                     continue
 
                 result.append(
-                    ExonPosition(
+                    ExonPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
                         start=int(exon.exon_number),
@@ -3153,11 +3092,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, [EXON], [start, end], "transcript_start", "transcript_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _rna_to_exon_variant(
@@ -3197,7 +3141,7 @@ class Core:
         strand: List[str],
         canonical: bool = False,
     ) -> List[ProteinPosition]:
-        result = []
+        result = set()
 
         for cdna in self._rna_to_cdna(
             transcript_id,
@@ -3209,7 +3153,7 @@ class Core:
             canonical=canonical,
             include_stop=False,
         ):
-            result.extend(
+            result.update(
                 self._cdna_to_protein(
                     [cdna.transcript_id],
                     cdna.start,
@@ -3221,7 +3165,7 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
     def _rna_to_protein_variant(
         self,
@@ -3237,7 +3181,7 @@ class Core:
         is_frameshift: bool = False,
         validate: bool = True,
     ) -> List[_ProteinSmallVariant]:
-        result = []
+        result = set()
 
         for cdna in self._rna_to_cdna_variant(
             transcript_id,
@@ -3253,7 +3197,7 @@ class Core:
             include_stop=False,
             validate=validate,
         ):
-            result.extend(
+            result.update(
                 self._cdna_to_protein_variant(
                     [cdna.transcript_id],
                     cdna.start,
@@ -3268,8 +3212,9 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(result, key=str)
 
+    @memoize
     def _rna_to_rna(
         self,
         transcript_id: List[str],
@@ -3285,25 +3230,21 @@ class Core:
             if not transcript_id:
                 return []
 
-        def convert(n: int, offset: int):
+        def convert(n: int, offset: int, rows: np.ndarray):
             result = []
 
-            mask = (
-                (self.df[TRANSCRIPT_ID].isin(transcript_id))
-                & (self.df["transcript_start"] <= n)
-                & (self.df["transcript_end"] >= n)
-                & (self.df["feature"] == EXON)
-            )
-            for _, exon in self.df[mask].iterrows():
-                # If the offset position can be normalized to a non-offset position, do so.
-                # Otherwise just return an offset position.
-                n_ = n + offset
-                if exon.transcript_start <= n_ <= exon.transcript_end:
-                    n = n_
-                    offset = 0
+            for exon in self._records(rows, RNA_COLUMNS + ("transcript_start", "transcript_end")):
+                # The rows were matched on `n`, so only an offset position needs checking. If it can
+                # be normalized to a non-offset position, do so. Otherwise just return an offset
+                # position.
+                if offset:
+                    n_ = n + offset
+                    if exon.transcript_start <= n_ <= exon.transcript_end:
+                        n = n_
+                        offset = 0
 
                 result.append(
-                    RnaPosition(
+                    RnaPosition._fast_init(
                         _core=self,
                         contig_id=exon.contig_id,
                         start=n,
@@ -3320,11 +3261,16 @@ class Core:
 
             return result
 
-        result_start = convert(start, start_offset)
+        # Find the rows containing the start and end positions at the same time
+        rows_start, rows_end = self._query_intervals(
+            TRANSCRIPT_ID, transcript_id, [EXON], [start, end], "transcript_start", "transcript_end"
+        )
+
+        result_start = convert(start, start_offset, rows_start)
         if (start, start_offset) == (end, end_offset):
-            return sorted(result_start)
+            return sorted(result_start, key=str)
         else:
-            result_end = convert(end, end_offset)
+            result_end = convert(end, end_offset, rows_end)
             return join_positions(result_start, result_end, TRANSCRIPT_ID)
 
     def _rna_to_rna_variant(
@@ -3380,40 +3326,6 @@ class Core:
         variant_list: List = []
 
         variant_class: Optional[Type[_SmallVariant]] = None
-        variant_class_map: Dict[Tuple, Type[_SmallVariant]] = {
-            (CDNA, DELETION): CdnaDeletion,
-            (CDNA, DELINS): CdnaDelins,
-            (CDNA, DUPLICATION): CdnaDuplication,
-            (CDNA, INSERTION): CdnaInsertion,
-            (CDNA, SUBSTITUTION): CdnaSubstitution,
-            (DNA, DELETION): DnaDeletion,
-            (DNA, DELINS): DnaDelins,
-            (DNA, DUPLICATION): DnaDuplication,
-            (DNA, INSERTION): DnaInsertion,
-            (DNA, SUBSTITUTION): DnaSubstitution,
-            (EXON, DELETION): ExonSmallVariant,
-            (EXON, DELINS): ExonSmallVariant,
-            (EXON, DUPLICATION): ExonSmallVariant,
-            (EXON, INSERTION): ExonSmallVariant,
-            (EXON, SUBSTITUTION): ExonSmallVariant,
-            (PROTEIN, DELETION): ProteinDeletion,
-            (PROTEIN, DELINS): ProteinDelins,
-            (PROTEIN, DUPLICATION): ProteinDuplication,
-            (PROTEIN, FRAMESHIFT): ProteinFrameshift,
-            (PROTEIN, INSERTION): ProteinInsertion,
-            (PROTEIN, SUBSTITUTION): ProteinSubstitution,
-            (RNA, DELETION): RnaDeletion,
-            (RNA, DELINS): RnaDelins,
-            (RNA, DUPLICATION): RnaDuplication,
-            (RNA, INSERTION): RnaInsertion,
-            (RNA, SUBSTITUTION): RnaSubstitution,
-        }
-
-        # Select the function to use to expand ambiguous sequences
-        if position.is_protein:
-            expand = expand_pep
-        else:
-            expand = expand_nt
 
         # Optionally, assert that the given ref matches the annotated one
         if validate:
@@ -3432,13 +3344,9 @@ class Core:
                 else:
                     return variant_list
 
-        for ref, alt in product(expand(refseq), expand(altseq)):
-            # Trim bases that are unchanged between the ref and alt alleles
-            new_ref, new_alt, start_adjust, end_adjust = collapse_seq_change(ref, alt)
-
-            # Determine the type of variant
-            variant_type = classify_seq_change(new_ref, new_alt)
-
+        for ref, new_ref, new_alt, start_adjust, end_adjust, variant_type in expand_seq_change(
+            refseq, altseq, position.is_protein
+        ):
             # Adjust the start position to the collapsed ref and alt. Example:
             # (start=1, start_offset=-3) + start_adjust=2 == (start=1, start_offset=-1)
             # (start=1, start_offset=-1) + start_adjust=2 == (start=2, start_offset=0)
@@ -3495,7 +3403,7 @@ class Core:
                 # change is, return an empty list because otherwise there's too many possible results
                 continue
             else:
-                variant_class = variant_class_map.get((position.position_type, variant_type))
+                variant_class = SMALL_VARIANT_CLASSES.get((position.position_type, variant_type))
 
             # Initialize a new variant object from the given position object
             if variant_class:
@@ -3712,7 +3620,7 @@ class Core:
         Returns:
             List[str]: Contig IDs
         """
-        return self._query_feature(CONTIG_ID, feature, alias=self.contig_alias)
+        return list(self._query_feature(CONTIG_ID, feature, alias=self.contig_alias))
 
     def exon_ids(self, feature: str = "") -> List[str]:
         """Return the exon IDs that map to the given feature. If no feature is given, return
@@ -3728,7 +3636,7 @@ class Core:
         Returns:
             List[str]: Exon IDs
         """
-        return self._query_feature(EXON_ID, feature, alias=self.exon_alias)
+        return list(self._query_feature(EXON_ID, feature, alias=self.exon_alias))
 
     def gene_ids(self, feature: str = "") -> List[str]:
         """Return the gene IDs that map to the given feature. If no feature is given, return
@@ -3744,7 +3652,7 @@ class Core:
         Returns:
             List[str]: Gene IDs
         """
-        return self._query_feature(GENE_ID, feature, alias=self.gene_alias)
+        return list(self._query_feature(GENE_ID, feature, alias=self.gene_alias))
 
     def gene_names(self, feature: str = "") -> List[str]:
         """Return the gene names that map to the given feature. If no feature is given, return
@@ -3760,7 +3668,7 @@ class Core:
         Returns:
             List[str]: Gene names
         """
-        return self._query_feature(GENE_NAME, feature, alias=self.gene_alias)
+        return list(self._query_feature(GENE_NAME, feature, alias=self.gene_alias))
 
     def protein_ids(self, feature: str = "") -> List[str]:
         """Return the protein IDs that map to the given feature. If no feature is given, return
@@ -3776,7 +3684,7 @@ class Core:
         Returns:
             List[str]: Protein IDs
         """
-        return self._query_feature(PROTEIN_ID, feature, alias=self.protein_alias)
+        return list(self._query_feature(PROTEIN_ID, feature, alias=self.protein_alias))
 
     def transcript_ids(self, feature: str = "") -> List[str]:
         """Return the transcript IDs that map to the given feature. If no feature is given, return
@@ -3792,7 +3700,7 @@ class Core:
         Returns:
             List[str]: Transcript IDs
         """
-        return self._query_feature(TRANSCRIPT_ID, feature, alias=self.transcript_alias)
+        return list(self._query_feature(TRANSCRIPT_ID, feature, alias=self.transcript_alias))
 
     def transcript_names(self, feature: str = "") -> List[str]:
         """Return the transcript names that map to the given feature. If no feature is given, return
@@ -3808,78 +3716,365 @@ class Core:
         Returns:
             List[str]: Transcript names
         """
-        return self._query_feature(TRANSCRIPT_NAME, feature, alias=self.transcript_alias)
+        return list(self._query_feature(TRANSCRIPT_NAME, feature, alias=self.transcript_alias))
 
-    @lru_cache
     def _query_feature(
         self, key: str, feature: str = "", alias: Optional[Callable] = None
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
+        # NOTE: The result is cached, so return an immutable tuple that is safe to share
+        return self._cached(
+            "query_feature",
+            (key, feature, alias),
+            lambda: self._build_query_feature(key, feature, alias),
+            maxsize=8192,
+        )
+
+    def _build_query_feature(
+        self, key: str, feature: str, alias: Optional[Callable]
+    ) -> Tuple[str, ...]:
         if feature:
             parts = []
 
             for feature, feature_type in self.normalize_id(feature):
-                if feature_type == CONTIG_ID:
-                    func = self._query_contig_id
-                elif feature_type == EXON_ID:
-                    func = self._query_exon_id
-                elif feature_type == GENE_ID:
-                    func = self._query_gene_id
-                elif feature_type == GENE_NAME:
-                    func = self._query_gene_name
-                elif feature_type == PROTEIN_ID:
-                    func = self._query_protein_id
-                elif feature_type == TRANSCRIPT_ID:
-                    func = self._query_transcript_id
-                elif feature_type == TRANSCRIPT_NAME:
-                    func = self._query_transcript_name
-                else:
+                if feature_type not in self._feature_ids:
                     raise ValueError(f"Unable to get {key} for {feature} ({feature_type})")
 
-                # Try different aliases to see which have a match to the annotations
-                feature_ = [feature]
-                if alias:
-                    feature_ += alias(feature)
+                # Try different aliases to see which have a match to the annotations (the alias list
+                # always includes the feature itself)
+                feature_ = alias(feature) if alias else [feature]
 
-                parts.append(func(feature_)[key])
+                parts.append(self._rows_with(feature_type, feature_))
 
-            if parts:
-                result = pd.concat(parts)
-            else:
-                result = pd.Series(dtype="object")
+            rows = np.unique(np.concatenate(parts)) if parts else np.array([], dtype=int)
+            result = self.df[key].iloc[rows]
         else:
             result = self.df[key]
 
-        return self._uniquify_series(result)
+        return tuple(self._uniquify_series(result))
+
+    def _query(self, feature: Union[List[str], str], col: str) -> pd.DataFrame:
+        feature = [feature] if isinstance(feature, str) else feature
+        sudbf = self.df.loc[self.df[col].isin(feature)]
+
+        return sudbf
 
-    def _query_contig_id(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, CONTIG_ID)
+    def clear_cache(self):
+        """Clear the lookup tables and converted positions cached from the annotations.
 
-    def _query_exon_id(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, EXON_ID)
+        Call this after changing the annotations (e.g. `df` or the canonical transcripts) of an
+        existing instance, so that later queries don't return results based on the old values.
+        """
+        for name in (
+            "_caches",
+            "_canonical_rows",
+            "_canonical_transcript_set",
+            "_feature_ids",
+            "_strand_sign",
+        ):
+            self.__dict__.pop(name, None)
+
+        # This is shared by all instances
+        expand_seq_change.cache_clear()
+
+    @cached_property
+    def _caches(self) -> DefaultDict[str, Dict]:
+        # Lookup tables derived from `self.df` and positions returned by the converters, by name.
+        # They're kept on the instance, rather than in a `lru_cache` on the method, so that they're
+        # released along with the instance.
+        return defaultdict(dict)
+
+    def _cached(
+        self, name: str, key: Hashable, build: Callable[[], Any], maxsize: Optional[int] = None
+    ) -> Any:
+        # Get the value cached as `key` in the cache `name`, building it the first time. If
+        # `maxsize` is given, the oldest value is dropped to make room once the cache is full.
+        cache = self._caches[name]
+        if key not in cache:
+            if maxsize is not None and len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            cache[key] = build()
+
+        return cache[key]
+
+    def _interval_index(
+        self, key: str, start_col: str, end_col: str
+    ) -> Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        # For each (`key` value, feature) pair, the start and end of every interval sorted by start,
+        # the running maximum of those ends, and the row position of each interval in `self.df`
+        return self._cached(
+            "interval_index",
+            (key, start_col, end_col),
+            lambda: self._build_interval_index(key, start_col, end_col),
+        )
 
-    def _query_gene_id(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, GENE_ID)
+    def _build_interval_index(
+        self, key: str, start_col: str, end_col: str
+    ) -> Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        starts = self._numeric_column(start_col)
+        ends = self._numeric_column(end_col)
 
-    def _query_gene_name(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, GENE_NAME)
+        index: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        groups = self.df.groupby([key, "feature"], observed=True, sort=False).indices
+        for group, rows in groups.items():
+            order = np.argsort(starts[rows], kind="stable")
+            rows = rows[order]
+            group_ends = ends[rows]
+            max_ends = np.maximum.accumulate(np.nan_to_num(group_ends, nan=-np.inf))
+            index[group] = (starts[rows], group_ends, max_ends, rows)
 
-    def _query_protein_id(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, PROTEIN_ID)
+        return index
 
-    def _query_transcript_id(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, TRANSCRIPT_ID)
+    def _query_interval(
+        self,
+        key: str,
+        values: List[str],
+        feature: Sequence[str],
+        n: int,
+        start_col: str = "start",
+        end_col: str = "end",
+    ) -> np.ndarray:
+        # Get the positions of the rows in `self.df` where `df[key].isin(values)`,
+        # `df.feature.isin(feature)`, `df[start_col] <= n` and `df[end_col] >= n`, only searching
+        # the intervals of the given `key` values and features
+        return self._query_intervals(key, values, feature, [n], start_col, end_col)[0]
+
+    def _query_intervals(
+        self,
+        key: str,
+        values: List[str],
+        feature: Sequence[str],
+        positions: List[int],
+        start_col: str = "start",
+        end_col: str = "end",
+    ) -> List[np.ndarray]:
+        # Same as `_query_interval`, but searches for several positions in one pass over the index
+        index = self._interval_index(key, start_col, end_col)
+        positions_ = np.asarray(positions, dtype="float64")
+
+        parts: List[List[np.ndarray]] = [[] for _ in positions]
+        for group in product(dict.fromkeys(values), dict.fromkeys(feature)):
+            if group in index:
+                starts, ends, max_ends, rows = index[group]
+                # Only the intervals between the first one that could reach `n` (going by the
+                # running maximum of the ends) and the last one that starts at or before `n` need
+                # to be checked
+                firsts = np.searchsorted(max_ends, positions_, side="left")
+                stops = np.searchsorted(starts, positions_, side="right")
+                for part, n, first, stop in zip(parts, positions, firsts, stops):
+                    if first < stop:
+                        part.append(rows[first:stop][ends[first:stop] >= n])
+
+        # Return the row positions in the same order as the dataframe
+        return [
+            np.sort(i[0] if len(i) == 1 else np.concatenate(i)) if i else np.array([], dtype=int)
+            for i in parts
+        ]
 
-    def _query_transcript_name(self, feature: Union[List[str], str]) -> pd.DataFrame:
-        return self._query(feature, TRANSCRIPT_NAME)
+    def _row_index(self, key: Union[str, Tuple[str, ...]]) -> Dict[Any, np.ndarray]:
+        # The positions of the rows in `self.df` for each value of the column `key`, or for each
+        # combination of values if `key` is a tuple of columns
+        by = list(key) if isinstance(key, tuple) else key
+        return self._cached(
+            "row_index", key, lambda: self.df.groupby(by, observed=True, sort=False).indices
+        )
 
-    def _query(self, feature: Union[List[str], str], col: str) -> pd.DataFrame:
-        feature = [feature] if isinstance(feature, str) else feature
-        sudbf = self.df.loc[self.df[col].isin(feature)]
+    def _rows_with(self, key: Union[str, Tuple[str, ...]], values: List) -> np.ndarray:
+        # Get the positions of the rows in `self.df` where `df[key].isin(values)`, in dataframe order
+        index = self._row_index(key)
+        parts = [index[i] for i in dict.fromkeys(values) if i in index]
+
+        return np.sort(np.concatenate(parts)) if parts else np.array([], dtype=int)
+
+    def _matches_any(self, col: str, rows: np.ndarray, values: Sequence[str]) -> np.ndarray:
+        # Equivalent to `np.isin(self._column(col)[rows], values)` for the one or two strands or
+        # features that the converters filter on, without building a hash table on every call
+        column, values_ = self._encoded_column(col, tuple(values))
+        column = column[rows]
+        mask = np.zeros(len(rows), dtype=bool)
+        for value in values_:
+            mask |= column == value
+
+        return mask
+
+    def _encoded_column(self, col: str, values: Tuple[str, ...]) -> Tuple[np.ndarray, Tuple]:
+        # Get a column along with the given values, both as the column's integer category codes if
+        # it is categorical, so that masks compare single bytes rather than strings. The codes of
+        # the values are cached since the converters only ever ask for a handful of strands and
+        # features, but the cache is bounded since other callers could ask for any values.
+        codes = self._category_codes(col)
+        if codes is None:
+            return self._column(col), values
+
+        categories, column = codes
+        encoded = self._cached(
+            "encoded_values",
+            (col, values),
+            lambda: tuple(i for i in categories.get_indexer(values) if i >= 0),
+            maxsize=1024,
+        )
+        return column, encoded
 
-        return sudbf
+    def _category_codes(self, col: str) -> Optional[Tuple[pd.Index, np.ndarray]]:
+        # The categories and the per-row category codes of a categorical column
+        return self._cached("category_codes", col, lambda: self._build_category_codes(col))
+
+    def _build_category_codes(self, col: str) -> Optional[Tuple[pd.Index, np.ndarray]]:
+        if not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+            return None
+
+        return self.df[col].cat.categories, self.df[col].cat.codes.to_numpy()
+
+    def _numeric_column(self, col: str) -> np.ndarray:
+        # The values of a numeric column as floats, with missing values as NaN so that, like the
+        # equivalent dataframe mask, they never match a comparison
+        return self._cached(
+            "numeric_column", col, lambda: self.df[col].to_numpy(dtype="float64", na_value=np.nan)
+        )
+
+    def _column(self, col: str) -> np.ndarray:
+        # The values of a column as a numpy array, which is much cheaper to index row-by-row than
+        # the dataframe. Integer columns are numpy ints, or floats with NaN if they have missing
+        # values, so values taken from them need to be converted with `int()`.
+        return self._cached("column", col, lambda: self._build_column(col))
+
+    def _build_column(self, col: str) -> np.ndarray:
+        codes = self._category_codes(col)
+        if codes is None:
+            series = self.df[col]
+            if not pd.api.types.is_integer_dtype(series.dtype):
+                return series.to_numpy()
+            elif series.hasnans:
+                return self._numeric_column(col)
+            else:
+                return series.to_numpy(dtype="int64")
+
+        # Every row of a categorical column references one interned string per category, so the
+        # positions built from these values share them and compare by identity first. Missing
+        # values have the code -1, which takes the NaN appended to the end of the categories.
+        categories, column = codes
+        values = [sys.intern(i) if isinstance(i, str) else i for i in categories]
+        return np.array(values + [np.nan], dtype=object).take(column)
+
+    @cached_property
+    def _strand_sign(self) -> np.ndarray:
+        # The strand of each row as a small integer: 1 for '+', -1 for '-' and 0 for anything else
+        strand = self._column("strand")
+        is_positive = strand == POSITIVE_STRAND
+        is_negative = strand == NEGATIVE_STRAND
+        return is_positive.astype(np.int8) - is_negative.astype(np.int8)
+
+    def _genomic_to_relative(self, rows: np.ndarray, n: int, base_col: str) -> np.ndarray:
+        # Convert the genomic position `n` to a position relative to `base_col`, the position at
+        # the 5' end of each row, counting in the direction of the row's strand
+        base = self._column(base_col)[rows]
+        on_negative_strand = self._strand_sign[rows] < 0
+        return np.where(
+            on_negative_strand,
+            self._column("end")[rows] - n + base,
+            n - self._column("start")[rows] + base,
+        )
+
+    def _map_each(self, positions: List[CdnaPosition], func: Callable, **kwargs) -> List:
+        # Map each position on its own transcript with the given position converter, converting
+        # each distinct (transcript, start, end, strand) only once, and return the unique results
+        keys = dict.fromkeys(
+            (i.transcript_id, i.start, i.start_offset, i.end, i.end_offset, i.strand)
+            for i in positions
+        )
+
+        result = set()
+        for transcript_id, start, start_offset, end, end_offset, strand in keys:
+            result.update(
+                func([transcript_id], start, start_offset, end, end_offset, [strand], **kwargs)
+            )
+
+        return sorted(result, key=str)
+
+    def _relative_to_genomic(
+        self, rows: np.ndarray, n: int, offset: int, base_col: str
+    ) -> np.ndarray:
+        # The inverse of `_genomic_to_relative`: convert the position `n`, relative to `base_col`,
+        # to a genomic position for each row. Only the first row is shifted by the offset.
+        offsets = np.zeros(len(rows), dtype=object)
+        offsets[:1] = offset
+
+        delta = n - self._column(base_col)[rows] + offsets
+        on_negative_strand = self._strand_sign[rows] < 0
+        return np.where(
+            on_negative_strand,
+            self._column("end")[rows] - delta,
+            self._column("start")[rows] + delta,
+        )
+
+    @cached_property
+    def _canonical_rows(self) -> np.ndarray:
+        # Whether each row of `self.df` belongs to a canonical transcript, checking each transcript
+        # only once
+        canonical_rows = np.zeros(len(self.df), dtype=bool)
+        for transcript_id, rows in self._row_index(TRANSCRIPT_ID).items():
+            if self.is_canonical_transcript(transcript_id):
+                canonical_rows[rows] = True
+
+        return canonical_rows
+
+    @cached_property
+    def _canonical_transcript_set(self) -> FrozenSet[str]:
+        # The canonical transcript IDs as a set, so checking a transcript doesn't scan the list. Only
+        # used by `is_canonical_transcript` once it has ruled out `_canonical_transcript` being a
+        # callable, so it's always a list here.
+        return frozenset(cast(List[str], self._canonical_transcript))
+
+    def _record_type(self, columns: Tuple[str, ...]) -> Type[Any]:
+        return self._cached(
+            "record_type", columns, lambda: namedtuple("Record", columns, rename=True)
+        )
+
+    def _records(
+        self, rows: Union[pd.Series, np.ndarray], columns: Tuple[str, ...]
+    ) -> Iterator[Any]:
+        # Iterate over the given columns of the rows of `self.df`, given as a boolean mask or as row
+        # positions, as named tuples. Equivalent to `self.df.loc[mask, columns].iterrows()`, without
+        # building a Series for every row.
+        if isinstance(rows, pd.Series):
+            rows = np.flatnonzero(rows.to_numpy())
+
+        record = self._record_type(columns)._make
+        return map(record, zip(*(self._column(col)[rows] for col in columns)))
+
+    def _iter_rows(self, rows: Union[pd.Series, np.ndarray], columns: List[str]) -> Iterator[Tuple]:
+        # Iterate over the given columns of the rows of `self.df`, given as a boolean mask or as row
+        # positions. Equivalent to `self.df.loc[mask, columns].itertuples(index=False, name=None)`.
+        if isinstance(rows, pd.Series):
+            rows = np.flatnonzero(rows.to_numpy())
+
+        return zip(*(self._column(col)[rows] for col in columns))
 
     def _uniquify_series(self, series: pd.Series) -> List:
-        return sorted(series.dropna().unique().tolist())
+        # Deduplicate categorical columns on their integer codes (-1 is missing) to skip
+        # materializing every value
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            values = series.cat.categories.take(pd.unique(codes[codes >= 0]))
+            return sorted(values.tolist())
+
+        values = pd.unique(series.to_numpy())
+        return sorted(values[pd.notna(values)].tolist())
+
+    @cached_property
+    def _feature_ids(self) -> Dict[str, FrozenSet[str]]:
+        # Every annotated ID/name of each feature type, for fast membership tests
+        return {
+            key: frozenset(self._uniquify_series(self.df[key]))
+            for key in (
+                CONTIG_ID,
+                EXON_ID,
+                GENE_ID,
+                GENE_NAME,
+                PROTEIN_ID,
+                TRANSCRIPT_ID,
+                TRANSCRIPT_NAME,
+            )
+        }
 
     # ---------------------------------------------------------------------------------------------
     # Functions for getting feature aliases
@@ -3967,14 +4162,19 @@ class Core:
             )
 
         # Try different variations on the feature ID until one is found
-        alias_list = [
-            feature,
-            strip_version(feature),
-            feature.lower(),
-            strip_version(feature).lower(),
-            feature.upper(),
-            strip_version(feature).upper(),
-        ]
+        stripped = strip_version(feature)
+        alias_list = list(
+            dict.fromkeys(
+                [
+                    feature,
+                    stripped,
+                    feature.lower(),
+                    stripped.lower(),
+                    feature.upper(),
+                    stripped.upper(),
+                ]
+            )
+        )
         for key in alias_list:
             if alias := alias_func(key):
                 if alias != key:
@@ -4003,19 +4203,18 @@ class Core:
             List[Tuple[str, str]]: List of (normalized ID/name, normalized type (e.g. 'gene',
                 'transcript', etc.))
         """
-        normalized = []
-
-        feature_type, result = self._normalize_id(feature)
-        if feature_type:
-            normalized = self._uniquify_series(result[feature_type])
+        feature_type, normalized = self._normalize_id(feature)
 
         return [(i, feature_type) for i in normalized]
 
-    @lru_cache
-    def _normalize_id(self, feature: str) -> Tuple[str, pd.DataFrame]:
-        feature_type = ""
-        result = pd.DataFrame()
+    def _normalize_id(self, feature: str) -> Tuple[str, Tuple[str, ...]]:
+        # NOTE: Only the normalized IDs are cached, not the matching rows of the dataframe, to keep
+        # the memory used by the cache bounded.
+        return self._cached(
+            "normalize_id", feature, lambda: self._build_normalize_id(feature), maxsize=65536
+        )
 
+    def _build_normalize_id(self, feature: str) -> Tuple[str, Tuple[str, ...]]:
         for key, func in [
             (CONTIG_ID, self._normalize_contig_id),
             (EXON_ID, self._normalize_exon_id),
@@ -4025,47 +4224,43 @@ class Core:
             (TRANSCRIPT_ID, self._normalize_transcript_id),
             (TRANSCRIPT_NAME, self._normalize_transcript_name),
         ]:
-            result = func(feature)
-            if not result.empty:
-                feature_type = key
-                break
-
-        return feature_type, result
-
-    def _normalize_contig_id(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.contig_alias(feature)
+            if normalized := func(feature):
+                return key, normalized
 
-        return self._query_contig_id(featurel)
+        return "", ()
 
-    def _normalize_exon_id(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.exon_alias(feature)
+    def _feature_type(self, feature: str) -> str:
+        # Return the type of the given feature (e.g. 'gene_id'), or an empty string if unknown
+        return self._normalize_id(feature)[0]
 
-        return self._query_exon_id(featurel)
+    def _normalize_contig_id(self, feature: str) -> Tuple[str, ...]:
+        # The alias list always includes the feature itself
+        return self._match_feature_ids(self.contig_alias(feature), CONTIG_ID)
 
-    def _normalize_gene_id(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.gene_alias(feature)
+    def _normalize_exon_id(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.exon_alias(feature), EXON_ID)
 
-        return self._query_gene_id(featurel)
+    def _normalize_gene_id(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.gene_alias(feature), GENE_ID)
 
-    def _normalize_gene_name(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.gene_alias(feature)
+    def _normalize_gene_name(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.gene_alias(feature), GENE_NAME)
 
-        return self._query_gene_name(featurel)
+    def _normalize_protein_id(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.protein_alias(feature), PROTEIN_ID)
 
-    def _normalize_protein_id(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.protein_alias(feature)
+    def _normalize_transcript_id(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.transcript_alias(feature), TRANSCRIPT_ID)
 
-        return self._query_protein_id(featurel)
+    def _normalize_transcript_name(self, feature: str) -> Tuple[str, ...]:
+        return self._match_feature_ids(self.transcript_alias(feature), TRANSCRIPT_NAME)
 
-    def _normalize_transcript_id(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.transcript_alias(feature)
+    def _match_feature_ids(self, feature: List[str], col: str) -> Tuple[str, ...]:
+        # Equivalent to the unique values of `self._query(feature, col)[col]`, but a set lookup
+        # is much cheaper than querying the dataframe
+        feature_ids = self._feature_ids[col]
 
-        return self._query_transcript_id(featurel)
-
-    def _normalize_transcript_name(self, feature: str) -> pd.DataFrame:
-        featurel = [feature] + self.transcript_alias(feature)
-
-        return self._query_transcript_name(featurel)
+        return tuple(sorted({i for i in feature if i in feature_ids}))
 
     # ---------------------------------------------------------------------------------------------
     # Functions for checking feature type
@@ -4079,7 +4274,7 @@ class Core:
         Returns:
             bool: True if is a contig else False
         """
-        return any((i[1] == CONTIG_ID for i in self.normalize_id(feature)))
+        return self._feature_type(feature) == CONTIG_ID
 
     def is_exon(self, feature: str) -> bool:
         """Check if the given ID or name is an exon.
@@ -4090,7 +4285,7 @@ class Core:
         Returns:
             bool: True if is an exon else False
         """
-        return any((i[1] == EXON_ID for i in self.normalize_id(feature)))
+        return self._feature_type(feature) == EXON_ID
 
     def is_gene(self, feature: str) -> bool:
         """Check if the given ID or name is a gene.
@@ -4101,7 +4296,7 @@ class Core:
         Returns:
             bool: True if is an gene else False
         """
-        return any((i[1] in (GENE_ID, GENE_NAME) for i in self.normalize_id(feature)))
+        return self._feature_type(feature) in (GENE_ID, GENE_NAME)
 
     def is_protein(self, feature: str) -> bool:
         """Check if the given ID or name is a protein.
@@ -4112,7 +4307,7 @@ class Core:
         Returns:
             bool: True if is an protein else False
         """
-        return any((i[1] == PROTEIN_ID for i in self.normalize_id(feature)))
+        return self._feature_type(feature) == PROTEIN_ID
 
     def is_transcript(self, feature: str) -> bool:
         """Check if the given ID or name is a transcript.
@@ -4123,7 +4318,7 @@ class Core:
         Returns:
             bool: True if is an transcript else False
         """
-        return any((i[1] in (TRANSCRIPT_ID, TRANSCRIPT_NAME) for i in self.normalize_id(feature)))
+        return self._feature_type(feature) in (TRANSCRIPT_ID, TRANSCRIPT_NAME)
 
     # ---------------------------------------------------------------------------------------------
     # Functions involving canonical transcripts
@@ -4156,7 +4351,7 @@ class Core:
         if callable(self._canonical_transcript):
             return self._canonical_transcript(transcript_id)
         else:
-            return transcript_id in self._canonical_transcript
+            return transcript_id in self._canonical_transcript_set
 
     # ---------------------------------------------------------------------------------------------
     # <feature>
@@ -4174,29 +4369,51 @@ class Core:
         result = []
 
         transcript_ids = self.transcript_ids(feature)
-        mask = (self.df[TRANSCRIPT_ID].isin(transcript_ids)) & (self.df["feature"] == CDNA)
-        for _, cdna in self.df[mask].iterrows():
-            if canonical and not self.is_canonical_transcript(cdna.transcript_id):
+        rows = self._rows_with(TRANSCRIPT_ID, transcript_ids)
+        rows = rows[self._matches_any("feature", rows, [CDNA])]
+        columns = [
+            CONTIG_ID,
+            "cdna_start",
+            "cdna_end",
+            "strand",
+            GENE_ID,
+            GENE_NAME,
+            TRANSCRIPT_ID,
+            TRANSCRIPT_NAME,
+            PROTEIN_ID,
+        ]
+        for (
+            contig_id,
+            start,
+            end,
+            strand,
+            gene_id,
+            gene_name,
+            transcript_id,
+            transcript_name,
+            protein_id,
+        ) in self._iter_rows(rows, columns):
+            if canonical and not self.is_canonical_transcript(transcript_id):
                 continue
 
             result.append(
                 CdnaPosition(
                     _core=self,
-                    contig_id=cdna.contig_id,
-                    start=cdna.cdna_start,
+                    contig_id=contig_id,
+                    start=int(start),
                     start_offset=0,
-                    end=cdna.cdna_end,
+                    end=int(end),
                     end_offset=0,
-                    strand=cdna.strand,
-                    gene_id=cdna.gene_id,
-                    gene_name=cdna.gene_name,
-                    transcript_id=cdna.transcript_id,
-                    transcript_name=cdna.transcript_name,
-                    protein_id=cdna.protein_id,
+                    strand=strand,
+                    gene_id=gene_id,
+                    gene_name=gene_name,
+                    transcript_id=transcript_id,
+                    transcript_name=transcript_name,
+                    protein_id=protein_id,
                 )
             )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     def dna(self, feature: str) -> List[DnaPosition]:
         """Return the DNA position(s) matching the given feature ID or name.
@@ -4211,21 +4428,16 @@ class Core:
         result = []
 
         # get the strand of the original feature
-        _, df = self._normalize_id(feature)
-        strand_list = self._uniquify_series(df["strand"])
+        strand_list = []
+        feature_type, normalized = self._normalize_id(feature)
+        if feature_type:
+            strand_list = self._uniquify_series(
+                self._query(list(normalized), feature_type)["strand"]
+            )
 
         for contig_id in self.contig_ids(feature):
-            for fasta in self.dna_fasta:
-                try:
-                    contig_seq = fasta[contig_id]
-                    break
-                except KeyError:
-                    continue
-            else:
-                raise KeyError(f"Sequence '{contig_id}' not found")
-
             start = 1
-            end = len(contig_seq)
+            end = self._get_fasta(self.dna_fasta, contig_id).length(contig_id)
             for strand in strand_list:
                 result.append(
                     DnaPosition(
@@ -4239,7 +4451,7 @@ class Core:
                     )
                 )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     def exon(self, feature: str, canonical: bool = False) -> List[ExonPosition]:
         """Return the exon position(s) matching the given feature ID or name.
@@ -4254,29 +4466,49 @@ class Core:
         result = []
 
         exon_ids = self.exon_ids(feature)
-        mask = (self.df[EXON_ID].isin(exon_ids)) & (self.df["feature"] == EXON)
-        for _, exon in self.df[mask].iterrows():
-            if canonical and not self.is_canonical_transcript(exon.transcript_id):
+        rows = self._rows_with(EXON_ID, exon_ids)
+        rows = rows[self._matches_any("feature", rows, [EXON])]
+        columns = [
+            CONTIG_ID,
+            "exon_number",
+            "strand",
+            GENE_ID,
+            GENE_NAME,
+            TRANSCRIPT_ID,
+            TRANSCRIPT_NAME,
+            EXON_ID,
+        ]
+        for (
+            contig_id,
+            exon_number,
+            strand,
+            gene_id,
+            gene_name,
+            transcript_id,
+            transcript_name,
+            exon_id,
+        ) in self._iter_rows(rows, columns):
+            if canonical and not self.is_canonical_transcript(transcript_id):
                 continue
 
             result.append(
                 ExonPosition(
                     _core=self,
-                    contig_id=exon.contig_id,
-                    start=int(exon.exon_number),
+                    contig_id=contig_id,
+                    start=int(exon_number),
                     start_offset=0,
-                    end=int(exon.exon_number),
+                    end=int(exon_number),
                     end_offset=0,
-                    strand=exon.strand,
-                    gene_id=exon.gene_id,
-                    gene_name=exon.gene_name,
-                    transcript_id=exon.transcript_id,
-                    transcript_name=exon.transcript_name,
-                    exon_id=exon.exon_id,
+                    strand=strand,
+                    gene_id=gene_id,
+                    gene_name=gene_name,
+                    transcript_id=transcript_id,
+                    transcript_name=transcript_name,
+                    exon_id=exon_id,
                 )
             )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     def gene(self, feature: str) -> List[DnaPosition]:
         """Return the gene position(s) matching the given feature ID or name.
@@ -4291,21 +4523,23 @@ class Core:
         result = []
 
         gene_ids = self.gene_ids(feature)
-        mask = (self.df[GENE_ID].isin(gene_ids)) & (self.df["feature"] == "gene")
-        for _, gene in self.df[mask].iterrows():
+        rows = self._rows_with(GENE_ID, gene_ids)
+        rows = rows[self._matches_any("feature", rows, ["gene"])]
+        columns = [CONTIG_ID, "start", "end", "strand"]
+        for contig_id, start, end, strand in self._iter_rows(rows, columns):
             result.append(
                 DnaPosition(
                     _core=self,
-                    contig_id=gene.contig_id,
-                    start=gene.start,
+                    contig_id=contig_id,
+                    start=int(start),
                     start_offset=0,
-                    end=gene.end,
+                    end=int(end),
                     end_offset=0,
-                    strand=gene.strand,
+                    strand=strand,
                 )
             )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     def protein(self, feature: str, canonical: bool = False) -> List[ProteinPosition]:
         """Return the protein position(s) matching the given feature ID or name.
@@ -4328,7 +4562,7 @@ class Core:
                 )
             )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     def rna(self, feature: str, canonical: bool = False) -> List[RnaPosition]:
         """Return the RNA position(s) matching the given feature ID or name.
@@ -4343,28 +4577,48 @@ class Core:
         result = []
 
         transcript_ids = self.transcript_ids(feature)
-        mask = (self.df[TRANSCRIPT_ID].isin(transcript_ids)) & (self.df["feature"] == "transcript")
-        for _, transcript in self.df[mask].iterrows():
-            if canonical and not self.is_canonical_transcript(transcript.transcript_id):
+        rows = self._rows_with(TRANSCRIPT_ID, transcript_ids)
+        rows = rows[self._matches_any("feature", rows, ["transcript"])]
+        columns = [
+            CONTIG_ID,
+            "transcript_start",
+            "transcript_end",
+            "strand",
+            GENE_ID,
+            GENE_NAME,
+            TRANSCRIPT_ID,
+            TRANSCRIPT_NAME,
+        ]
+        for (
+            contig_id,
+            start,
+            end,
+            strand,
+            gene_id,
+            gene_name,
+            transcript_id,
+            transcript_name,
+        ) in self._iter_rows(rows, columns):
+            if canonical and not self.is_canonical_transcript(transcript_id):
                 continue
 
             result.append(
                 RnaPosition(
                     _core=self,
-                    contig_id=transcript.contig_id,
-                    start=transcript.transcript_start,
+                    contig_id=contig_id,
+                    start=int(start),
                     start_offset=0,
-                    end=transcript.transcript_end,
+                    end=int(end),
                     end_offset=0,
-                    strand=transcript.strand,
-                    gene_id=transcript.gene_id,
-                    gene_name=transcript.gene_name,
-                    transcript_id=transcript.transcript_id,
-                    transcript_name=transcript.transcript_name,
+                    strand=strand,
+                    gene_id=gene_id,
+                    gene_name=gene_name,
+                    transcript_id=transcript_id,
+                    transcript_name=transcript_name,
                 )
             )
 
-        return sorted(set(result))
+        return sorted(dict.fromkeys(result), key=str)
 
     # ---------------------------------------------------------------------------------------------
     # Utility functions
@@ -4408,12 +4662,46 @@ class Core:
             else:
                 is_frameshift = False
 
-            pep_altseq = "".join(AMINO_ACID_TABLE[codon] for codon in split_by_codon(codon_altseq))
+            pep_altseq = translate(codon_altseq)
             pep_altseq_set.add((pep_altseq, is_frameshift))
 
         return sorted(pep_altseq_set)
 
 
+@lru_cache(maxsize=SEQ_CHANGE_CACHE_SIZE)
+def expand_seq_change(
+    refseq: str, altseq: str, is_protein: bool
+) -> Tuple[Tuple[str, str, str, int, int, str], ...]:
+    """Expand any ambiguous bases in a reference -> alternate allele change, then collapse and
+    classify each of the resulting unambiguous changes.
+
+    The result only depends on the alleles, so it is cached and shared between all of the positions
+    that a variant maps to. The cache holds up to `SEQ_CHANGE_CACHE_SIZE` allele changes and is
+    emptied by `Core.clear_cache`.
+
+    Args:
+        refseq (str): Reference allele
+        altseq (str): Alternate allele
+        is_protein (bool): The alleles are amino acids rather than nucleotides
+
+    Returns:
+        Tuple[Tuple[str, str, str, int, int, str], ...]: For each unambiguous change, the expanded
+            reference allele, the collapsed reference and alternate alleles, the start and end
+            adjustments from collapsing them, and the type of change
+    """
+    expand = expand_pep if is_protein else expand_nt
+
+    result = []
+    for ref, alt in product(expand(refseq), expand(altseq)):
+        # Trim bases that are unchanged between the ref and alt alleles
+        new_ref, new_alt, start_adjust, end_adjust = collapse_seq_change(ref, alt)
+        # Determine the type of variant
+        variant_type = classify_seq_change(new_ref, new_alt)
+        result.append((ref, new_ref, new_alt, start_adjust, end_adjust, variant_type))
+
+    return tuple(result)
+
+
 def join_positions(start: List, end: List, merge_on: str) -> List:
     """Return the combination of two list of position or variant objects - one of start positions
     and one of end positions - into one list by the given key (e.g. 'transcript_id').
@@ -4430,16 +4718,23 @@ def join_positions(start: List, end: List, merge_on: str) -> List:
     """
     result = set()
 
-    for start_pos, end_pos in product(start, end):
-        # Make sure that the positions are sorted by position
-        if start_pos.start > end_pos.start:
-            start_pos, end_pos = end_pos, start_pos
-        # Make a new position from the start of the 1st position and end of the 2nd
-        start_key = getattr(start_pos, merge_on)
-        end_key = getattr(end_pos, merge_on)
-        if start_key == end_key:
-            assert start_pos.__class__ == end_pos.__class__
-            new = start_pos.copy_from(start_pos, end=end_pos.end, end_offset=end_pos.end_offset)
+    # Only positions with the same key are combined, so group the end positions by key rather than
+    # comparing every start position to every end position
+    end_by_key: Dict[Any, List] = {}
+    for end_pos in end:
+        end_by_key.setdefault(getattr(end_pos, merge_on), []).append(end_pos)
+
+    for start_pos in start:
+        for end_pos in end_by_key.get(getattr(start_pos, merge_on), []):
+            # Make sure that the positions are sorted by position
+            first, second = start_pos, end_pos
+            if first.start > second.start:
+                first, second = second, first
+            # Make a new position from the start of the 1st position and end of the 2nd
+            assert first.__class__ == second.__class__
+            new = first.copy_from(first, end=second.end, end_offset=second.end_offset)
             result.add(new)
 
-    return sorted(result)  # type: ignore
+    # Positions are ordered by their string representation, so compute it once per position rather
+    # than twice per comparison
+    return sorted(result, key=str)  # type: ignore
@@ -644,7 +644,7 @@ def infer_protein_id(df: pd.DataFrame) -> pd.DataFrame:
             continue
 
         subdf = group[group.feature.isin(["cdna", "stop_codon"])]
-        for index, _ in subdf.iterrows():
+        for index in subdf.index:
             if pd.isna(df.loc[index, "protein_id"]):
                 print(f"Adding protein ID '{protein_id}' to row {index}", file=sys.stderr)
                 df.loc[index, "protein_id"] = protein_id
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Optional
+from typing import Dict, Optional
 
 from pyfaidx import Fasta
 
@@ -41,6 +41,8 @@ class PyfaidxFasta:
     def __init__(self, fasta: Fasta, strand: str = ""):
         self.fasta = fasta
         self.strand = strand
+        # Sequence lengths are looked up on every fetch, so cache them by reference ID
+        self._length: Dict[str, int] = {}
 
     def __contains__(self, reference: str) -> bool:
         return reference in self.fasta
@@ -69,10 +71,19 @@ class PyfaidxFasta:
 
     def fetch(self, reference: str, start: int, end: int) -> str:
         self._try_buffer(reference, start, end)
-        return str(self.fasta[reference][start:end])
+
+        # Negative coordinates count back from the end of the sequence, which only the
+        # `FastaRecord` slice handles. Otherwise, fetch the (1-based, closed) interval directly.
+        if start < 0 or end < 0:
+            return str(self.fasta[reference][start:end])
+
+        return str(self.fasta.get_seq(reference, start + 1, end))
 
     def length(self, reference: str) -> int:
-        return len(self.fasta[reference])
+        if reference not in self._length:
+            self._length[reference] = len(self.fasta[reference])
+
+        return self._length[reference]
 
 
 @lru_cache
@@ -18,6 +18,10 @@ DNA = {
     "N": ["A", "C", "G", "T"],
 }
 
+# IUPAC nucleotide code to its complement, as translation tables for `str.translate`
+DNA_COMPLEMENT_TABLE = str.maketrans("ABCDGHKMRTVYabcdghkmrtvy", "TVGHCDMKYABRtvghcdmkyabr")
+RNA_COMPLEMENT_TABLE = str.maketrans("ABCDGHKMRTUVYabcdghkmrtuvy", "UVGHCDMKYAABRuvghcdmkyaabr")
+
 # single-letter amino acid to all possible codons
 # NOTE: these are only the mammalian (non-mitochondrial) codons!
 DNA_CODON_TABLE = {
@@ -1,13 +1,17 @@
 """Collection of utility methods used throughout the package."""
 from itertools import product, zip_longest
-from math import floor
 from string import punctuation
 from typing import Iterator, List, Optional, Tuple, Union
 
-from Bio.Seq import Seq
-
 from .constants import DELETION, DELINS, DUPLICATION, INSERTION, SUBSTITUTION
-from .tables import DNA, DNA_CODON_TABLE, PROTEIN
+from .tables import (
+    AMINO_ACID_TABLE,
+    DNA,
+    DNA_CODON_TABLE,
+    DNA_COMPLEMENT_TABLE,
+    PROTEIN,
+    RNA_COMPLEMENT_TABLE,
+)
 
 # Dictionary used to replace punctuation in a string
 PUNCTUATION_TO_UNDERSCORE = str.maketrans(punctuation + " ", "_" * len(punctuation + " "))
@@ -22,7 +26,7 @@ def calc_cdna_to_protein(position: int) -> int:
     Returns:
         int: Equivalent protein position
     """
-    return floor((position - 1) / 3 + 1)
+    return (position + 2) // 3
 
 
 def classify_seq_change(refseq: str, altseq: str) -> str:
@@ -461,7 +465,15 @@ def reverse_complement(sequence: str) -> str:
     Returns:
         str: Reverse complement of the nucleotide sequence
     """
-    return str(Seq(sequence).reverse_complement())
+    # Same behaviour as `Bio.Seq.reverse_complement`, without the overhead of creating `Seq` objects
+    if "U" in sequence or "u" in sequence:
+        if "T" in sequence or "t" in sequence:
+            raise ValueError("Mixed RNA/DNA found")
+        table = RNA_COMPLEMENT_TABLE
+    else:
+        table = DNA_COMPLEMENT_TABLE
+
+    return sequence.translate(table)[::-1]
 
 
 def reverse_translate(peptide: str) -> Iterator[str]:
@@ -607,3 +619,26 @@ def strip_version(key: str) -> str:
         str: Identifier with the version number removed
     """
     return key.rsplit(".", 1)[0]
+
+
+def translate(sequence: str) -> str:
+    """Translate a nucleotide sequence into amino acids, one codon at a time.
+
+    Examples:
+        >>> translate('ATGTAA')
+        'M*'
+
+    Args:
+        sequence (str): Unambiguous nucleotide sequence
+
+    Raises:
+        KeyError: The sequence contains a codon that does not code for an amino acid
+        ValueError: Length of the nucleotide sequence is not divisible by 3
+
+    Returns:
+        str: Amino acid sequence
+    """
+    if len(sequence) % 3 != 0:
+        raise ValueError(f"Sequence ({sequence}) length is not divisible by 3")
+
+    return "".join([AMINO_ACID_TABLE[sequence[i : i + 3]] for i in range(0, len(sequence), 3)])
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, fields
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, List, Tuple, Type, TypeVar
 
 from .constants import (
     CDNA,
@@ -23,11 +23,53 @@ from .utils import classify_seq_change, format_hgvs_position
 if TYPE_CHECKING:
     from .core import Core
 
+_BaseT = TypeVar("_BaseT", bound="_Base")
+
+
+def _field_names(cls: Type[_Base]) -> Tuple[str, ...]:
+    """Get the names of the fields defined by a `_Base`-derived class, in definition order.
+
+    Args:
+        cls (Type[_Base]): `_Base`-derived class
+
+    Returns:
+        Tuple[str, ...]: Field names
+    """
+    # Stored on the class itself the first time it's needed (looked up in the class `__dict__`
+    # so that a subclass doesn't pick up the names of its parent)
+    names = cls.__dict__.get("_FIELD_NAMES")
+    if names is None:
+        names = tuple(i.name for i in fields(cls))
+        cls._FIELD_NAMES = names
+
+    return names
+
+
+def _field_name_set(cls: Type[_Base]) -> FrozenSet[str]:
+    """Get the names of the fields defined by a `_Base`-derived class, as a set.
+
+    Args:
+        cls (Type[_Base]): `_Base`-derived class
+
+    Returns:
+        FrozenSet[str]: Field names
+    """
+    # Stored on the class the same way as `_field_names`
+    names = cls.__dict__.get("_FIELD_NAME_SET")
+    if names is None:
+        names = frozenset(_field_names(cls))
+        cls._FIELD_NAME_SET = names
+
+    return names
+
 
 @dataclass(eq=True, frozen=True)
 class _Base:
     """Base class for all position and variant classes."""
 
+    _FIELD_NAMES: ClassVar[Tuple[str, ...]]
+    _FIELD_NAME_SET: ClassVar[FrozenSet[str]]
+
     _core: Core
 
     @classmethod
@@ -41,12 +83,23 @@ class _Base:
         Returns:
             a new object of the same class as the class that calls this method
         """
-        return cls(
-            **{
-                **{k: v for k, v in obj.asdict().items() if k in [i.name for i in fields(cls)]},
-                **kwargs,
-            }
-        )  # type: ignore
+        obj_fields = _field_names(type(obj))
+        values = {**{k: obj[k] for k in _field_names(cls) if k in obj_fields}, **kwargs}
+        if values.keys() != _field_name_set(cls):
+            # Let `__init__` raise the appropriate error for the missing or unexpected fields
+            return cls(**values)  # type: ignore
+
+        return cls._fast_init(**values)
+
+    @classmethod
+    def _fast_init(cls: Type[_BaseT], **kwargs: Any) -> _BaseT:
+        # Initialize a new object without calling the dataclass `__init__`, which sets each field of
+        # a frozen dataclass with a separate `object.__setattr__` call. There are no checks for
+        # missing or unexpected fields, so every field must be given.
+        obj = object.__new__(cls)
+        obj.__dict__.update(kwargs)
+
+        return obj
 
     def __getitem__(self, item: Any) -> Any:
         return getattr(self, item)
@@ -236,7 +289,7 @@ class _Base:
         Returns:
             Dict[str, Any]: Dictionary of attribute names and corresponding values
         """
-        return {f.name: self[f.name] for f in fields(self)}
+        return {k: self[k] for k in _field_names(type(self))}
 
     def to_cdna(self, canonical: bool = False) -> List:
         """Map this position to zero or more cDNA positions.
@@ -2509,3 +2509,118 @@ def test_same_rna(ensembl100):
             transcript_name="NRAS-201",
         )
     ]
+
+
+# -------------------------------------------------------------------------------------------------
+# map_many
+# -------------------------------------------------------------------------------------------------
+def test_map_many(ensembl100):
+    result = ensembl100.map_many(
+        position_type="dna", feature="12", start=[25245351, 1], to_type="cdna", canonical=True
+    )
+    assert [[str(i) for i in j] for j in result] == [["ENST00000256078:c.34"], []]
+    assert result == [
+        [
+            CdnaPosition(
+                _core=ensembl100,
+                contig_id="12",
+                start=34,
+                start_offset=0,
+                end=34,
+                end_offset=0,
+                strand="-",
+                gene_id="ENSG00000133703",
+                gene_name="KRAS",
+                transcript_id="ENST00000256078",
+                transcript_name="KRAS-201",
+                protein_id="ENSP00000256078",
+            )
+        ],
+        [],
+    ]
+
+
+def test_map_many_with_end(ensembl100):
+    result = ensembl100.map_many(
+        position_type="cdna",
+        feature="ENST00000311936",
+        start=[34, 1, 100000],
+        end=[35, 3, 100001],
+        to_type="protein",
+    )
+    assert [[str(i) for i in j] for j in result] == [
+        ["ENSP00000308495:p.12"],
+        ["ENSP00000308495:p.1"],
+        [],
+    ]
+    assert result == [
+        [
+            ProteinPosition(
+                _core=ensembl100,
+                contig_id="12",
+                start=12,
+                start_offset=0,
+                end=12,
+                end_offset=0,
+                strand="-",
+                gene_id="ENSG00000133703",
+                gene_name="KRAS",
+                transcript_id="ENST00000311936",
+                transcript_name="KRAS-202",
+                protein_id="ENSP00000308495",
+            )
+        ],
+        [
+            ProteinPosition(
+                _core=ensembl100,
+                contig_id="12",
+                start=1,
+                start_offset=0,
+                end=1,
+                end_offset=0,
+                strand="-",
+                gene_id="ENSG00000133703",
+                gene_name="KRAS",
+                transcript_id="ENST00000311936",
+                transcript_name="KRAS-202",
+                protein_id="ENSP00000308495",
+            )
+        ],
+        [],
+    ]
+
+
+def test_map_many_unknown_feature(ensembl100):
+    with pytest.raises(ValueError):
+        ensembl100.map_many(position_type="dna", feature="FOO", start=[1], to_type="cdna")
+
+
+def test_map_many_mismatched_start_end(ensembl100):
+    with pytest.raises(ValueError):
+        ensembl100.map_many(position_type="dna", feature="7", start=[1, 2], end=[2], to_type="cdna")
+
+
+# -------------------------------------------------------------------------------------------------
+# offset positions on multiple transcripts
+# -------------------------------------------------------------------------------------------------
+def test_rna_to_exon_offset_multiple_transcripts(ensembl100):
+    # Normalizing the offset on one transcript must not let the rows of another transcript, which
+    # only contain the un-offset position, through
+    transcript_ids = ["ENST00000556131", "ENST00000544455"]
+    expected = [
+        i for j in transcript_ids for i in ensembl100._rna_to_exon([j], 667, -20, 667, 0, ["-"])
+    ]
+    result = ensembl100._rna_to_exon(transcript_ids, 667, -20, 667, 0, ["-"])
+    assert sorted(result, key=str) == sorted(expected, key=str)
+    assert all(i.transcript_id != "ENST00000544455" for i in result)
+
+
+# -------------------------------------------------------------------------------------------------
+# clear_cache
+# -------------------------------------------------------------------------------------------------
+def test_clear_cache(ensembl100):
+    expected = ensembl100.to_cdna("12:g.25245351")
+    assert "_caches" in vars(ensembl100)
+    ensembl100.clear_cache()
+    assert "_caches" not in vars(ensembl100)
+    assert ensembl100.to_cdna("12:g.25245351") == expected
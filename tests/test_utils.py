@@ -2,6 +2,7 @@ import pytest
 
 from pyvariant.ensembl_cache import normalize_release, normalize_species, reference_by_release
 from pyvariant.utils import (
+    calc_cdna_to_protein,
     classify_seq_change,
     collapse_seq_change,
     expand_nt,
@@ -23,9 +24,18 @@ from pyvariant.utils import (
     split_common_sequence,
     split_insertion,
     strip_version,
+    translate,
 )
 
 
+def test_calc_cdna_to_protein():
+    assert calc_cdna_to_protein(1) == 1
+    assert calc_cdna_to_protein(3) == 1
+    assert calc_cdna_to_protein(4) == 2
+    assert calc_cdna_to_protein(36) == 12
+    assert calc_cdna_to_protein(37) == 13
+
+
 def test_classify_seq_change():
     assert classify_seq_change("ATG", "") == "deletion"
     assert classify_seq_change("ATG", "CT") == "delins"
@@ -200,6 +210,10 @@ def test_reference_by_release():
 def test_reverse_complement():
     assert reverse_complement("AGCT") == "AGCT"
     assert reverse_complement("AACC") == "GGTT"
+    assert reverse_complement("ANRy") == "rYNT"
+    assert reverse_complement("AUGC") == "GCAU"
+    with pytest.raises(ValueError):
+        reverse_complement("ATU")
 
 
 def test_reverse_translate():
@@ -228,3 +242,11 @@ def test_split_insertion():
 def test_strip_version():
     assert strip_version("NM_000546.5") == "NM_000546"
     assert strip_version("NM_000546") == "NM_000546"
+
+
+def test_translate():
+    assert translate("") == ""
+    assert translate("ATGTAA") == "M*"
+    with pytest.raises(ValueError):
+        # Error raised when the sequence is not divisible by 3
+        translate("ATGT")